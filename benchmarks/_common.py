@@ -0,0 +1,33 @@
+"""Shared helpers for the benchmark scripts."""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+DATA_PATH = os.path.join(ROOT, 'houseprice.csv')
+
+from house_pca.pipeline import HousePricePipeline, numeric_features  # noqa: E402
+
+
+def load_house_numeric():
+    """``df_num`` and SalePrice as prepared by the pipeline."""
+    pipeline = HousePricePipeline(DATA_PATH)
+    return numeric_features(pipeline.engineer()), pipeline.target
+
+
+def load_house_std():
+    """Standardized numeric predictors, i.e. ``df_num_std``."""
+    _, df_num_std = HousePricePipeline(DATA_PATH).scale()
+    return df_num_std
+
+
+def best_of(func, repeat=5):
+    """Minimum wall time of ``repeat`` calls, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
@@ -0,0 +1,37 @@
+"""Single-core throughput of reconstruction-error scoring.
+
+Usage: python benchmarks/bench_anomaly.py [n_rows]
+"""
+
+import os
+import sys
+
+os.environ.setdefault('OMP_NUM_THREADS', '1')
+os.environ.setdefault('OPENBLAS_NUM_THREADS', '1')
+os.environ.setdefault('MKL_NUM_THREADS', '1')
+
+import numpy as np  # noqa: E402
+
+from _common import best_of, load_house_std  # noqa: E402
+
+from house_pca.anomaly import ReconstructionScorer  # noqa: E402
+from house_pca.decomposition import covariance_eig  # noqa: E402
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    df_num_std = load_house_std()
+    eig_val, eig_vec = covariance_eig(np.cov(df_num_std.T), 5)
+    scorer = ReconstructionScorer(eig_vec, eig_val).fit_threshold(df_num_std)
+
+    rng = np.random.default_rng(0)
+    feed = df_num_std[rng.integers(0, len(df_num_std), n_rows)]
+    seconds = best_of(lambda: scorer.score(feed), repeat=3)
+    print(f'rows scored      : {n_rows}')
+    print(f'seconds          : {seconds:.3f}')
+    print(f'rows per minute  : {n_rows / seconds * 60:,.0f} (one BLAS thread)')
+    print(f'flagged fraction : {scorer.flag(feed).mean():.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Bootstrap of the house PCA: loop of full refits vs batched ``bootstrap_pca``.
+
+Usage: python benchmarks/bench_bootstrap.py [n_boot]
+"""
+
+import sys
+
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+
+from _common import best_of, load_house_numeric
+
+from house_pca.bootstrap import bootstrap_pca
+from house_pca.decomposition import covariance_eig
+
+
+def refit_loop(X, n_boot):
+    rng = np.random.default_rng(0)
+    values = []
+    for _ in range(n_boot):
+        sample = X[rng.integers(0, len(X), len(X))]
+        eig_val, _ = covariance_eig(np.cov(StandardScaler().fit_transform(sample).T), 5)
+        values.append(eig_val)
+    return np.array(values)
+
+
+def main():
+    n_boot = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    df_num, _ = load_house_numeric()
+    X = df_num.to_numpy(dtype=np.float64)
+
+    t_loop = best_of(lambda: refit_loop(X, n_boot), repeat=1)
+    t_batch = best_of(lambda: bootstrap_pca(df_num, n_boot=n_boot), repeat=3)
+    result = bootstrap_pca(df_num, n_boot=n_boot)
+
+    print(f'rows: {X.shape[0]}, features: {X.shape[1]}, replicates: {n_boot}')
+    print(f'refit loop: {t_loop:.2f} s, bootstrap_pca: {t_batch:.2f} s '
+          f'({t_loop / t_batch:.1f}x)')
+    print(result.eigenvalue_intervals().round(3).to_string())
+
+
+if __name__ == '__main__':
+    main()
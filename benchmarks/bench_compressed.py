@@ -0,0 +1,89 @@
+"""Throughput of reading compressed listing feeds in chunks.
+
+The house rows are repeated up to ``size_mb`` of CSV and compressed with
+the command-line ``gzip -1`` and ``zstd``.  Each file is then parsed in
+100,000-row chunks by four methods:
+
+* decompress to a temporary file first, then read the plain CSV,
+* let ``read_csv`` decompress inline,
+* decompress in a background thread (``read_chunks`` default),
+* decompress in a child process.
+
+Usage: python benchmarks/bench_compressed.py [size_mb]
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from _common import DATA_PATH
+
+from house_pca.io import read_chunks
+
+
+def consume(path, **kwargs):
+    return sum(len(chunk) for chunk in read_chunks(path, 100_000, **kwargs))
+
+
+def decompress_then_read(path, directory):
+    plain = os.path.join(directory, 'plain.csv')
+    tool = 'gzip' if path.endswith('.gz') else 'zstd'
+    with open(plain, 'wb') as out:
+        subprocess.run([tool, '-dc', path], stdout=out, check=True)
+    try:
+        return consume(plain)
+    finally:
+        os.remove(plain)
+
+
+def timed(func):
+    start = time.perf_counter()
+    rows = func()
+    return rows, time.perf_counter() - start
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 2048
+    with open(DATA_PATH, 'rb') as f:
+        header, body = f.readline(), f.read()
+    repeats = max(1, size_mb * 2 ** 20 // len(body))
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'listings.csv')
+        with open(csv_path, 'wb') as out:
+            out.write(header)
+            for _ in range(repeats):
+                out.write(body)
+        raw_mb = os.path.getsize(csv_path) / 2 ** 20
+        files = []
+        if shutil.which('gzip'):
+            with open(csv_path + '.gz', 'wb') as out:
+                subprocess.run(['gzip', '-1', '-c', csv_path], stdout=out, check=True)
+            files.append(csv_path + '.gz')
+        if shutil.which('zstd'):
+            subprocess.run(['zstd', '-q', '-f', csv_path, '-o', csv_path + '.zst'], check=True)
+            files.append(csv_path + '.zst')
+        os.remove(csv_path)
+
+        print(f'{raw_mb:,.0f} MB of CSV; throughput in MB/s of uncompressed CSV')
+        print(f'{"file":<6} {"method":<26} {"seconds":>8} {"MB/s":>7}')
+        for path in files:
+            methods = [('decompress, then read', lambda: decompress_then_read(path, directory)),
+                       ('read_csv inline', lambda: consume(path, decompress='pandas')),
+                       ('background thread', lambda: consume(path, decompress='thread')),
+                       ('child process', lambda: consume(path, decompress='process'))]
+            for name, func in methods:
+                try:
+                    _, seconds = timed(func)
+                except ImportError:
+                    print(f'{os.path.splitext(path)[1]:<6} {name:<26} {"needs zstandard":>16}')
+                    continue
+                print(f'{os.path.splitext(path)[1]:<6} {name:<26} {seconds:>8.1f} '
+                      f'{raw_mb / seconds:>7.1f}')
+
+
+if __name__ == '__main__':
+    main()
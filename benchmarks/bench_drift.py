@@ -0,0 +1,75 @@
+"""Drift monitoring: ``DriftMonitor.update`` vs a covariance refit per batch.
+
+The stream resamples the house rows with small Gaussian jitter. Halfway through, it starts
+drawing only listings built after 2000, which simulates a wave of new
+construction that shifts Buiding_age and the size features.
+
+Usage: python benchmarks/bench_drift.py [n_batches] [batch_size]
+"""
+
+import sys
+
+import numpy as np
+
+from _common import DATA_PATH, best_of
+
+from house_pca.decomposition import covariance_eig
+from house_pca.drift import DriftMonitor
+from house_pca.pipeline import HousePricePipeline, numeric_features
+
+
+def main():
+    n_batches = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    pipeline = HousePricePipeline(DATA_PATH)
+    features = numeric_features(pipeline.engineer())
+    scaler, _ = pipeline.scale()
+    eig_val, eig_vec = pipeline.decompose()
+    X = features.to_numpy(dtype=np.float64)
+    recent = np.flatnonzero(features['YearBuilt'].to_numpy() > 2000)
+
+    noise = 0.05 * X.std(axis=0)
+    rng = np.random.default_rng(0)
+    batches = []
+    for i in range(n_batches):
+        pool = recent if i >= n_batches // 2 else np.arange(len(X))
+        rows = rng.choice(pool, batch_size)
+        batches.append(X[rows] + rng.normal(0.0, noise, (batch_size, X.shape[1])))
+
+    def make_monitor():
+        return DriftMonitor(eig_vec[:, :5], eig_val[:5], scaler.mean_, scaler.scale_,
+                            total_variance=eig_val.sum(), features=list(features.columns))
+
+    monitor = make_monitor()
+    first_alert = None
+    for i, batch in enumerate(batches):
+        alerts = monitor.update(batch)
+        if alerts and first_alert is None:
+            first_alert = i, alerts
+
+    def stream_monitor():
+        m = make_monitor()
+        for batch in batches:
+            m.update(batch)
+
+    def stream_refit():
+        for batch in batches:
+            covariance_eig(np.cov(((batch - scaler.mean_) / scaler.scale_).T), 5)
+
+    t_monitor = best_of(stream_monitor, repeat=3) / n_batches
+    t_refit = best_of(stream_refit, repeat=3) / n_batches
+
+    print(f'{n_batches} batches x {batch_size:,} rows, {X.shape[1]} features; '
+          f'drift starts at batch {n_batches // 2}')
+    print(f'per batch: monitor update {t_monitor * 1e3:.2f} ms, '
+          f'covariance + eigh {t_refit * 1e3:.2f} ms')
+    if first_alert:
+        print(f'first alert at batch {first_alert[0]}:')
+        for alert in first_alert[1]:
+            print(f'  {alert.metric} = {alert.value:.3f} > {alert.threshold} {alert.detail}')
+    report = monitor.report()
+    print(report.iloc[[n_batches // 2 - 1, n_batches // 2 + 2, -1]].round(3).to_string())
+
+
+if __name__ == '__main__':
+    main()
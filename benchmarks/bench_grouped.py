@@ -0,0 +1,70 @@
+"""Per-Neighborhood PCA fits: pandas groupby + sklearn loop vs ``fit_grouped``.
+
+The house rows are resampled with jitter to ``n_rows`` listings, keeping
+their Neighborhood labels.
+
+Usage: python benchmarks/bench_grouped.py [n_rows]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import PCA
+from sklearn.preprocessing import StandardScaler
+
+from _common import DATA_PATH, best_of
+
+from house_pca.grouped import fit_grouped
+from house_pca.pipeline import HousePricePipeline, numeric_features
+
+
+def groupby_loop(frame, key):
+    models = {}
+    for name, block in frame.groupby(key):
+        features = block.drop(columns=key)
+        if len(features) > features.shape[1]:
+            scaler = StandardScaler().fit(features)
+            models[name] = scaler, PCA(5).fit(scaler.transform(features))
+    return models
+
+
+def groupby_transform(frame, key, models):
+    parts = []
+    for name, block in frame.groupby(key):
+        if name in models:
+            scaler, pca = models[name]
+            parts.append(pd.DataFrame(pca.transform(scaler.transform(block.drop(columns=key))),
+                                      index=block.index))
+    return pd.concat(parts)
+
+
+def main(key='Neighborhood'):
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    data = HousePricePipeline(DATA_PATH).engineer()
+    features = numeric_features(data)
+    rng = np.random.default_rng(0)
+    rows = rng.integers(0, len(data), n_rows)
+    X = features.to_numpy(dtype=np.float64)[rows]
+    X *= rng.normal(1.0, 0.02, X.shape)
+    groups = data[key].to_numpy()[rows]
+    frame = pd.DataFrame(X, columns=features.columns).assign(**{key: groups})
+
+    t_loop = best_of(lambda: groupby_loop(frame, key), repeat=1)
+    models = groupby_loop(frame, key)
+    t_loop_transform = best_of(lambda: groupby_transform(frame, key, models), repeat=1)
+    t_serial = best_of(lambda: fit_grouped(X, groups, processes=1), repeat=1)
+    t_pool = best_of(lambda: fit_grouped(X, groups), repeat=1)
+    model = fit_grouped(X, groups)
+    t_transform = best_of(lambda: model.transform(X, groups), repeat=1)
+
+    print(f'rows: {n_rows:,}, features: {X.shape[1]}, groups: {len(np.unique(groups))} '
+          f'({len(model.keys)} fitted, rest pooled)')
+    print(f'{"method":<30} {"fit s":>7} {"transform s":>12}')
+    print(f'{"groupby + sklearn loop":<30} {t_loop:>7.2f} {t_loop_transform:>12.2f}')
+    print(f'{"fit_grouped, in-process":<30} {t_serial:>7.2f} {t_transform:>12.2f}')
+    print(f'{"fit_grouped, process pool":<30} {t_pool:>7.2f} {t_transform:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
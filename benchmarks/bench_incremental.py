@@ -0,0 +1,68 @@
+"""Incremental (two-pass, mini-batch) PCA against the full in-memory fit.
+
+The house data is replicated 1x to 1,000x with small per-replica noise on the
+numeric columns and streamed in chunks, so the incremental fit never holds
+more than one chunk.  The full fit materializes ``df_num_std`` for all rows.
+
+Usage: python benchmarks/bench_incremental.py [max_scale]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import PCA
+from sklearn.preprocessing import StandardScaler
+
+from _common import DATA_PATH
+
+from house_pca.decomposition import canonicalize_sklearn_pca
+from house_pca.incremental import IncrementalHousePCA
+from house_pca.pipeline import clean, engineer, load, numeric_features
+
+
+def replicas(raw, scale, per_chunk):
+    """Yield chunks of ``per_chunk`` noisy copies of ``raw``, ``scale`` copies in all."""
+    numeric = raw.select_dtypes(include=[np.number]).columns.drop('SalePrice')
+    noise = 0.05 * raw[numeric].std().to_numpy()
+    for first in range(0, scale, per_chunk):
+        copies = []
+        for copy in range(first, min(scale, first + per_chunk)):
+            rng = np.random.default_rng(copy)
+            jittered = raw.copy()
+            jittered[numeric] = raw[numeric] + rng.standard_normal((len(raw), len(numeric))) * noise
+            copies.append(jittered)
+        yield pd.concat(copies)
+
+
+def main():
+    max_scale = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    raw = load(DATA_PATH)
+    print(f'{"scale":>6} {"rows":>9} {"incr s":>8} {"incr rows/s":>12} {"full s":>7} '
+          f'{"min |cos|":>9} {"max var err":>11}')
+    for scale in (1, 10, 100, 1000):
+        if scale > max_scale:
+            break
+        per_chunk = max(1, min(scale, 10))
+        start = time.perf_counter()
+        model = IncrementalHousePCA(5).fit_chunks(lambda: replicas(raw, scale, per_chunk))
+        t_incremental = time.perf_counter() - start
+
+        start = time.perf_counter()
+        all_rows = pd.concat(replicas(raw, scale, per_chunk))
+        df_num = numeric_features(engineer(clean(all_rows)))
+        full = canonicalize_sklearn_pca(
+            PCA(n_components=5, random_state=0).fit(StandardScaler().fit_transform(df_num)))
+        t_full = time.perf_counter() - start
+
+        cosines = np.abs(np.sum(full.components_ * model.components_, axis=1))
+        var_error = np.abs(model.explained_variance_ / full.explained_variance_ - 1)
+        print(f'{scale:>6} {model.n_rows_:>9} {t_incremental:>8.2f} '
+              f'{model.n_rows_ / t_incremental:>12,.0f} {t_full:>7.2f} '
+              f'{cosines.min():>9.5f} {var_error.max():>11.2e}')
+    print('full-fit time includes materializing all rows; incremental time covers both passes')
+
+
+if __name__ == '__main__':
+    main()
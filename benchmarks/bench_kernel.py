@@ -0,0 +1,49 @@
+"""Time and peak memory of Nyström kernel PCA on the house data and 1M rows.
+
+Usage: python benchmarks/bench_kernel.py [n_synthetic_rows]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from _common import load_house_std
+
+from house_pca.kernel import NystroemKernelPCA
+
+
+def measure(X, n_landmarks):
+    model = NystroemKernelPCA(n_components=5, n_landmarks=n_landmarks)
+    tracemalloc.start()
+    start = time.perf_counter()
+    model.fit(X)
+    fit_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    model.transform(X)
+    transform_seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return fit_seconds, transform_seconds, peak
+
+
+def main():
+    n_synthetic = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    df_num_std = load_house_std()
+    # Synthetic rows drawn from a Gaussian with the house covariance.
+    rng = np.random.default_rng(0)
+    synthetic = rng.multivariate_normal(np.zeros(df_num_std.shape[1]),
+                                        np.cov(df_num_std.T), size=n_synthetic)
+
+    print(f'{"rows":>10} {"landmarks":>9} {"fit s":>8} {"transform s":>11} {"peak MiB":>9}')
+    for X in (df_num_std, synthetic):
+        for n_landmarks in (100, 300, 1000):
+            fit_s, transform_s, peak = measure(X, n_landmarks)
+            print(f'{X.shape[0]:>10} {n_landmarks:>9} {fit_s:>8.2f} '
+                  f'{transform_s:>11.2f} {peak / 2 ** 20:>9.1f}')
+    print('(peak memory excludes the input matrix, which is allocated beforehand)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Batched 20-NN latency in PC space: k-d tree and brute force.
+
+Synthetic listings are drawn with the variances of the five house PCs.
+
+Usage: python benchmarks/bench_neighbors.py [n_listings]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from _common import best_of, load_house_std
+
+from house_pca.decomposition import covariance_eig
+from house_pca.neighbors import ComparableIndex, brute_force_knn
+
+
+def recall(found, truth):
+    return np.mean([len(np.intersect1d(f, t)) / len(t) for f, t in zip(found, truth)])
+
+
+def main(k=20, n_queries=1000, n_brute=100):
+    n_listings = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    eig_val, _ = covariance_eig(np.cov(load_house_std().T), 5)
+    rng = np.random.default_rng(0)
+    scores = rng.standard_normal((n_listings, 5)) * np.sqrt(eig_val)
+    queries = rng.standard_normal((n_queries, 5)) * np.sqrt(eig_val)
+
+    start = time.perf_counter()
+    tree = ComparableIndex(scores)
+    t_tree_build = time.perf_counter() - start
+
+    t_tree = best_of(lambda: tree.query(queries, k), repeat=3)
+    t_brute = best_of(lambda: brute_force_knn(scores, queries[:n_brute], k), repeat=1)
+
+    _, truth = brute_force_knn(scores, queries[:n_brute], k)
+    _, tree_ids = tree.query(queries[:n_brute], k)
+
+    new = rng.standard_normal((1000, 5)) * np.sqrt(eig_val)
+    start = time.perf_counter()
+    tree.add(new, np.arange(n_listings, n_listings + 1000))
+    t_insert = time.perf_counter() - start
+
+    print(f'listings: {n_listings:,}, k = {k}')
+    print(f'{"method":<14} {"build s":>8} {"ms/query":>9} {"recall":>7}')
+    print(f'{"k-d tree":<14} {t_tree_build:>8.2f} {t_tree / n_queries * 1e3:>9.4f} '
+          f'{recall(tree_ids, truth):>7.3f}')
+    print(f'{"brute force":<14} {0:>8.2f} {t_brute / n_brute * 1e3:>9.4f} {1:>7.3f}')
+    print(f'insert 1,000 listings into k-d tree: {t_insert * 1e3:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
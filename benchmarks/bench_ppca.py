@@ -0,0 +1,54 @@
+"""Probabilistic PCA on data with NaNs vs PCA.py's sentinel fills.
+
+The raw house features are used without ``clean`` (NaN where PCA.py fills
+0, a median or a "No ..." label), resampled to ``n_rows`` for the timing.
+The components are compared with the pipeline's filled-data fit.
+
+Usage: python benchmarks/bench_ppca.py [n_rows]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from _common import DATA_PATH
+
+from house_pca.pipeline import HousePricePipeline, engineer, load, numeric_features
+from house_pca.ppca import ProbabilisticPCA
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    raw = numeric_features(engineer(load(DATA_PATH)))
+    X = raw.to_numpy(dtype=np.float64)
+    model = ProbabilisticPCA().fit(X)
+    _, eig_vec = HousePricePipeline(DATA_PATH).decompose()
+    cosines = np.abs(np.sum(model.components_.T * eig_vec[:, :5], axis=0))
+    # Passes needed, and the largest angle to a fit run to a fixed point.
+    exact = ProbabilisticPCA(tol=0, max_iter=3000).fit(X)
+    for accelerate in (False, True):
+        fit = ProbabilisticPCA(accelerate=accelerate).fit(X)
+        angles = np.degrees(np.arccos(np.clip(
+            np.abs(np.sum(fit.components_ * exact.components_, axis=1)), 0.0, 1.0)))
+        print(f'accelerate={accelerate}: {fit.n_iter_} passes, '
+              f'largest angle to the fixed point {angles.max():.3f} deg')
+
+    rng = np.random.default_rng(0)
+    big = X[rng.integers(0, len(X), n_rows)]
+    big += rng.normal(0.0, 0.01, big.shape) * np.nanstd(X, axis=0)
+    start = time.perf_counter()
+    fitted = ProbabilisticPCA().fit(big)
+    seconds = time.perf_counter() - start
+
+    print(f'house data: {np.isnan(X).mean():.1%} of entries missing, '
+          f'{model.n_iter_} EM passes')
+    print('|cos| with the sentinel-filled components:',
+          ' '.join(f'PC{i + 1} {c:.3f}' for i, c in enumerate(cosines)))
+    print(f'{n_rows:,} rows x {X.shape[1]} features: {fitted.n_iter_} passes in '
+          f'{seconds:.1f} s ({seconds / fitted.n_iter_:.2f} s per pass, '
+          f'including the initial covariance pass)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Storage size, accuracy and read cost of quantized PC scores.
+
+Synthetic listings are drawn with the variances of the five house PCs and
+stored as float64 ``.npy`` (what ``df_pca`` holds) and as int8 / int16
+``QuantizedScores``; reads go through a memory map.
+
+Usage: python benchmarks/bench_quantize.py [n_listings]
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from _common import best_of, load_house_std
+
+from house_pca.decomposition import covariance_eig
+from house_pca.quantize import QuantizedScores
+
+
+def main(n_sample=100_000):
+    n_listings = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    eig_val, _ = covariance_eig(np.cov(load_house_std().T), 5)
+    rng = np.random.default_rng(0)
+    scores = rng.standard_normal((n_listings, 5)) * np.sqrt(eig_val)
+    sample = np.sort(rng.choice(n_listings, n_sample, replace=False))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_path = os.path.join(tmp, 'scores.npy')
+        np.save(raw_path, scores)
+        raw = np.load(raw_path, mmap_mode='r')
+        rows = [('float64', os.path.getsize(raw_path), 0.0, 0.0,
+                 best_of(lambda: np.array(raw), 3), best_of(lambda: raw[sample], 3))]
+        for dtype in ('int16', 'int8'):
+            directory = os.path.join(tmp, dtype)
+            quantized = QuantizedScores.from_scores(scores, dtype)
+            report = quantized.error_report(scores)
+            quantized.save(directory)
+            stored = QuantizedScores.load(directory)
+            size = sum(os.path.getsize(os.path.join(directory, f))
+                       for f in os.listdir(directory))
+            rows.append((dtype, size, report['max_abs_error'].max(),
+                         report['relative_rmse'].max(),
+                         best_of(lambda: stored.dequantize(), 3),
+                         best_of(lambda: stored.dequantize(sample), 3)))
+
+    print(f'listings: {n_listings:,}, 5 components; random read of {n_sample:,} rows')
+    print(f'{"storage":<8} {"MB":>8} {"ratio":>6} {"max err":>9} {"rel rmse":>9} '
+          f'{"full read s":>11} {"sample ms":>10}')
+    for name, size, max_err, rel, t_full, t_sample in rows:
+        print(f'{name:<8} {size / 1e6:>8.1f} {rows[0][1] / size:>6.1f} {max_err:>9.2e} '
+              f'{rel:>9.2e} {t_full:>11.3f} {t_sample * 1e3:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
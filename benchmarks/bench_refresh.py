@@ -0,0 +1,47 @@
+"""Warm-started eigenvector refresh versus a cold decomposition.
+
+A covariance of decaying spectrum is decomposed, a batch of new rows is
+added, and the top-k eigenpairs of the updated matrix are obtained either
+from scratch (np.linalg.eig as in PCA.py, and eigh) or with refresh_eig
+started from the old eigenvectors.
+"""
+
+import numpy as np
+
+from _common import best_of
+
+from house_pca.decomposition import covariance_eig, refresh_eig
+from house_pca.moments import Moments
+
+
+def synthetic_rows(rng, n_rows, n_features):
+    spectrum = 1.0 / np.arange(1, n_features + 1) ** 0.8
+    return rng.standard_normal((n_rows, n_features)) * np.sqrt(spectrum)
+
+
+def main(k=10):
+    rng = np.random.default_rng(0)
+    print(f'{"features":>8} {"eig s":>8} {"eigh s":>8} {"refresh s":>9} {"iters":>5} '
+          f'{"max |sin angle|":>15}')
+    for n_features in (250, 500, 1000, 2000):
+        rotation, _ = np.linalg.qr(rng.standard_normal((n_features, n_features)))
+        old = Moments.from_array(synthetic_rows(rng, 4 * n_features, n_features) @ rotation)
+        new = old + Moments.from_array(
+            synthetic_rows(rng, n_features // 10, n_features) @ rotation)
+        _, previous = covariance_eig(old.covariance(), k)
+        cov_mat = new.covariance()
+
+        t_eig = best_of(lambda: np.linalg.eig(cov_mat), repeat=1)
+        t_eigh = best_of(lambda: covariance_eig(cov_mat, k), repeat=3)
+        t_refresh = best_of(lambda: refresh_eig(cov_mat, previous), repeat=3)
+
+        _, cold = covariance_eig(cov_mat, k)
+        _, warm, n_iter = refresh_eig(cov_mat, previous, return_n_iter=True)
+        cosines = np.linalg.svd(cold.T @ warm, compute_uv=False)
+        error = np.sqrt(max(0.0, 1 - cosines.min() ** 2))
+        print(f'{n_features:>8} {t_eig:>8.3f} {t_eigh:>8.3f} {t_refresh:>9.4f} {n_iter:>5} '
+              f'{error:>15.2e}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+"""Runtime overhead of robust PCA over the plain np.cov / eig path."""
+
+import numpy as np
+
+from _common import best_of, load_house_std
+
+from house_pca.robust import robust_pca
+
+
+def main():
+    df_num_std = load_house_std()
+
+    def plain():
+        np.linalg.eig(np.cov(df_num_std.T))
+
+    def robust():
+        robust_pca(df_num_std, n_components=5)
+
+    t_plain = best_of(plain)
+    t_robust = best_of(robust)
+    print(f'rows x features      : {df_num_std.shape}')
+    print(f'np.cov + eig         : {t_plain * 1e3:8.2f} ms')
+    print(f'robust_pca           : {t_robust * 1e3:8.2f} ms')
+    print(f'overhead             : {t_robust / t_plain:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
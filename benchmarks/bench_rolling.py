@@ -0,0 +1,54 @@
+"""24-month rolling PCA: prefix-sum windows vs refitting each window's rows.
+
+The house rows are resampled to ``n_rows`` listings, keeping their sale dates.
+
+Usage: python benchmarks/bench_rolling.py [n_rows]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from _common import DATA_PATH, best_of
+
+from house_pca.decomposition import covariance_eig
+from house_pca.pipeline import HousePricePipeline, numeric_features
+from house_pca.rolling import RollingWindowPCA
+
+
+def refit_windows(X, codes, months):
+    values = []
+    for end in range(codes.min() + months - 1, codes.max() + 1):
+        rows = X[(codes > end - months) & (codes <= end)]
+        std = rows.std(axis=0)
+        std[std == 0] = 1.0
+        values.append(covariance_eig(np.cov(((rows - rows.mean(axis=0)) / std).T), 5)[0])
+    return values
+
+
+def main(months=24):
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    data = HousePricePipeline(DATA_PATH).engineer()
+    rng = np.random.default_rng(0)
+    rows = rng.integers(0, len(data), n_rows)
+    X = numeric_features(data).to_numpy(dtype=np.float64)[rows]
+    year, month = data['YrSold'].to_numpy()[rows], data['MoSold'].to_numpy()[rows]
+    codes = year * 12 + month - 1
+
+    start = time.perf_counter()
+    model = RollingWindowPCA().fit(X, year, month)
+    t_build = time.perf_counter() - start
+    n_windows = len(model.periods) - months + 1
+    t_slide = best_of(lambda: model.explained_variance(months), repeat=3) / n_windows
+    t_refit = best_of(lambda: refit_windows(X, codes, months), repeat=1) / n_windows
+
+    print(f'rows: {n_rows:,}, features: {X.shape[1]}, months: {len(model.periods)}, '
+          f'{n_windows} windows of {months} months')
+    print(f'build per-month moments: {t_build:.2f} s (once)')
+    print(f'per window: prefix sums {t_slide * 1e3:.2f} ms, '
+          f'refit from rows {t_refit * 1e3:.1f} ms ({t_refit / t_slide:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
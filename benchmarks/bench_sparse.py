@@ -0,0 +1,71 @@
+"""Sparse-loading PCA: variance kept vs raw columns needed, and scoring cost.
+
+Scoring reads a CSV of the house rows repeated ``repeats`` times and runs
+clean -> engineer -> project, either on every column with the dense
+components or on ``source_columns()`` only with the sparse ones.
+
+Usage: python benchmarks/bench_sparse.py [repeats]
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from _common import DATA_PATH, best_of
+
+from house_pca.pipeline import HousePricePipeline, clean, engineer, numeric_features
+from house_pca.sparse import SparseLoadingPCA
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    pipeline = HousePricePipeline(DATA_PATH, current_year=2024)
+    features = numeric_features(pipeline.engineer())
+    eig_val, _ = pipeline.decompose()
+    projection = pipeline.projection()
+
+    print(f'{"n_nonzero":>9} {"features":>8} {"raw cols":>8} {"variance kept":>13}')
+    for n_nonzero in (3, 6, 10, 20):
+        model = SparseLoadingPCA(n_nonzero=n_nonzero).fit(features)
+        kept = model.adjusted_variance_.sum() / eig_val[:5].sum()
+        print(f'{n_nonzero:>9} {len(model.used_columns_):>8} {len(model.source_columns()):>8} '
+              f'{kept:>13.1%}')
+
+    model = SparseLoadingPCA(n_nonzero=3).fit(features)
+    with open(DATA_PATH, 'rb') as f:
+        header, body = f.readline(), f.read()
+    with tempfile.TemporaryDirectory() as directory:
+        feed = os.path.join(directory, 'feed.csv')
+        with open(feed, 'wb') as out:
+            out.write(header)
+            for _ in range(repeats):
+                out.write(body)
+
+        def dense():
+            data = engineer(clean(pd.read_csv(feed, index_col=0)), 2024)
+            return projection.transform(numeric_features(data)[pipeline.feature_names])
+
+        def sparse_path():
+            raw = pd.read_csv(feed, index_col=0, usecols=['Id', *model.source_columns()])
+            return model.transform(engineer(clean(raw), 2024))
+
+        t_dense = best_of(dense, repeat=3)
+        t_sparse = best_of(sparse_path, repeat=3)
+        n_rows = repeats * (body.count(b'\n'))
+
+    print(f'scoring {n_rows:,} rows with n_nonzero=3 '
+          f'({len(model.source_columns())} of {len(header.split(b","))} raw columns):')
+    print(f'dense, all columns: {t_dense:.2f} s; sparse, used columns: {t_sparse:.2f} s '
+          f'({t_dense / t_sparse:.1f}x)')
+    X = features.to_numpy(dtype=np.float64)
+    t_dense_product = best_of(lambda: projection.transform(X), repeat=20)
+    t_sparse_product = best_of(lambda: model.transform(X), repeat=20)
+    print(f'projection only ({len(X)} rows): dense {t_dense_product * 1e6:.0f} us, '
+          f'sparse {t_sparse_product * 1e6:.0f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Validation cost relative to CSV ingestion.
+
+Usage: python benchmarks/bench_validation.py [replicas]
+"""
+
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+from _common import DATA_PATH, best_of
+
+from house_pca.pipeline import HousePricePipeline
+from house_pca.validation import house_schema
+
+
+def main():
+    replicas = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    raw = pd.read_csv(DATA_PATH, index_col=0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'listings.csv')
+        pd.concat([raw] * replicas, ignore_index=True).to_csv(path)
+        schema = house_schema()
+        for label, dtype in (('default dtypes', None), ('schema.dtypes()', schema.dtypes())):
+            t_read = best_of(lambda: pd.read_csv(path, index_col=0, dtype=dtype), repeat=3)
+            frame = pd.read_csv(path, index_col=0, dtype=dtype)
+            t_validate = best_of(lambda: schema.validate(frame), repeat=3)
+            report = schema.validate(frame)
+            print(f'{label}: {len(frame)} rows, read_csv {t_read:.3f} s, '
+                  f'validate {t_validate:.3f} s ({t_validate / t_read:.1%} of ingestion), '
+                  f'{len(report.quarantine)} quarantined')
+        # The pipeline's own load stage, which reads with schema.dtypes().
+        t_load = best_of(lambda: HousePricePipeline(path, schema=schema).load(), repeat=3)
+        frame = HousePricePipeline(path, schema=schema).load()
+        t_validate = best_of(lambda: schema.validate(frame), repeat=3)
+        print(f'HousePricePipeline(schema=...): load {t_load:.3f} s, '
+              f'validate {t_validate:.3f} s ({t_validate / t_load:.1%} of ingestion)')
+
+
+if __name__ == '__main__':
+    main()
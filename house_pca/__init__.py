@@ -0,0 +1,31 @@
+"""Dimension reduction utilities for the house price dataset."""
+
+from .anomaly import ReconstructionScorer
+from .bootstrap import BootstrapResult, bootstrap_pca
+from .cache import DecompositionCache, array_digest
+from .cross_validation import CrossValidationResult, kfold_pca_regression
+from .decomposition import (align_signs, canonicalize, canonicalize_sklearn_pca, covariance_eig,
+                            data_eig, refresh_eig)
+from .distributed import DistributedPCAResult, fit_distributed, shard_moments
+from .drift import DriftAlert, DriftMonitor
+from .encoding import ORDINAL_LEVELS, encode_ordinal, ordinal_codes
+from .grouped import GroupedPCAModel, fit_grouped
+from .impute import SketchImputer
+from .incremental import IncrementalHousePCA
+from .io import read_chunks
+from .kernel import NystroemKernelPCA
+from .loadings import (component_table, contributions, loadings, squared_cosines,
+                       top_contributors)
+from .moments import Moments
+from .neighbors import ComparableIndex, brute_force_knn
+from .pipeline import HousePricePipeline
+from .ppca import ProbabilisticPCA
+from .profiling import FrameProfiler, profile_csv, profile_frame
+from .projection import AffineProjection
+from .quantize import QuantizedScores
+from .robust import robust_covariance, robust_pca
+from .rolling import RollingWindowPCA
+from .seeding import DEFAULT_SEED, make_rng
+from .sketches import CardinalitySketch, FrequentItemsSketch, QuantileSketch
+from .sparse import SparseLoadingPCA
+from .validation import ColumnRule, Schema, ValidationReport, house_schema
@@ -0,0 +1,74 @@
+"""Flag listings that the retained components reconstruct poorly.
+
+For standardized rows ``z`` and orthonormal components ``V`` the squared
+reconstruction error is ``||z||^2 - ||z V||^2``, so it is computed from the
+k component scores without ever forming the reconstructed matrix ``z V V^T``.
+Hotelling's T^2 reuses the same scores.  Rows are processed in fixed-size
+chunks, so memory stays at ``chunk_size * n_features`` whatever the feed size.
+"""
+
+import numpy as np
+
+
+class ReconstructionScorer:
+    """Squared prediction error (SPE / Q) and Hotelling's T² per row.
+
+    Parameters
+    ----------
+    eig_vec : ndarray of shape (n_features, k)
+        Retained components, e.g. ``eigenvector``.
+    eig_val : ndarray of shape (k,)
+        Their eigenvalues (component variances).
+    mean, scale : ndarray of shape (n_features,), optional
+        Scaler statistics applied to raw rows; omit for ``df_num_std`` input.
+    chunk_size : int
+        Rows per vectorized block.
+    """
+
+    def __init__(self, eig_vec, eig_val, mean=None, scale=None, chunk_size=65536):
+        eig_vec = np.asarray(eig_vec, dtype=np.float64)
+        n_features = eig_vec.shape[0]
+        self.mean = np.zeros(n_features) if mean is None else np.asarray(mean, dtype=np.float64)
+        self.scale = np.ones(n_features) if scale is None else np.asarray(scale, dtype=np.float64)
+        self.eig_vec = eig_vec
+        self.inv_sqrt_val = 1.0 / np.sqrt(np.asarray(eig_val, dtype=np.float64))
+        self.chunk_size = chunk_size
+        self.spe_threshold_ = None
+        self.t2_threshold_ = None
+
+    def _score_block(self, block, spe, t2):
+        z = (block - self.mean) / self.scale
+        scores = z @ self.eig_vec
+        np.maximum(np.einsum('ij,ij->i', z, z) - np.einsum('ij,ij->i', scores, scores),
+                   0.0, out=spe)
+        scores *= self.inv_sqrt_val
+        np.einsum('ij,ij->i', scores, scores, out=t2)
+
+    def score(self, X):
+        """Return ``(spe, t2)`` arrays with one value per row of ``X``."""
+        X = np.asarray(X, dtype=np.float64)
+        spe = np.empty(X.shape[0])
+        t2 = np.empty(X.shape[0])
+        for start in range(0, X.shape[0], self.chunk_size):
+            stop = start + self.chunk_size
+            self._score_block(X[start:stop], spe[start:stop], t2[start:stop])
+        return spe, t2
+
+    def score_chunks(self, chunks):
+        """Yield ``(spe, t2)`` for each array or DataFrame of an iterable feed."""
+        for chunk in chunks:
+            yield self.score(chunk)
+
+    def fit_threshold(self, X, quantile=0.99):
+        """Set alert thresholds at the given quantile of the training scores."""
+        spe, t2 = self.score(X)
+        self.spe_threshold_ = float(np.quantile(spe, quantile))
+        self.t2_threshold_ = float(np.quantile(t2, quantile))
+        return self
+
+    def flag(self, X):
+        """Boolean mask of rows above either training threshold."""
+        if self.spe_threshold_ is None:
+            raise ValueError('call fit_threshold before flag')
+        spe, t2 = self.score(X)
+        return (spe > self.spe_threshold_) | (t2 > self.t2_threshold_)
@@ -0,0 +1,129 @@
+"""Memoization of decomposition results keyed by matrix content.
+
+Re-running a notebook cell on the same ``df_num_std`` hashes the matrix
+(BLAKE2b over its raw buffer, shape and dtype) together with the call
+parameters and returns the stored eigenpairs instead of recomputing them.
+Keys also include ``CACHE_FORMAT``, so that entries written before a change
+in a cached function's output convention are never served.
+Entries live in an in-memory LRU bounded by total bytes, optionally backed
+by a directory of ``.npz`` files that is bounded the same way.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+# Bump whenever a cached function changes its output convention (order, signs,
+# dtypes); old on-disk entries then stop matching.  2: sign-canonical,
+# largest-first eigenpairs from ``covariance_eig`` / ``data_eig``.  3: the sign
+# pivot is the first entry within round-off of the largest magnitude.
+CACHE_FORMAT = 3
+
+
+def array_digest(array, **params):
+    """Hex digest of an array's content plus keyword parameters."""
+    array = np.ascontiguousarray(array)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{array.dtype.str}{array.shape}'.encode())
+    digest.update(memoryview(array).cast('B'))
+    digest.update(repr(sorted(params.items())).encode())
+    return digest.hexdigest()
+
+
+class DecompositionCache:
+    """Byte-bounded LRU of array tuples with an optional on-disk tier.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Upper bound on the summed ``nbytes`` of arrays held in memory.
+    directory : str, optional
+        Where to persist entries; omitted means memory only.
+    max_disk_bytes : int
+        Upper bound on the size of ``directory``; oldest files go first.
+    """
+
+    def __init__(self, max_bytes=64 * 2 ** 20, directory=None,
+                 max_disk_bytes=1024 * 2 ** 20):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        return self._size
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.npz')
+
+    def get(self, key):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        if self.directory is not None and os.path.exists(self._path(key)):
+            with np.load(self._path(key)) as stored:
+                value = tuple(stored[f'arr_{i}'] for i in range(len(stored.files)))
+            os.utime(self._path(key))
+            self.hits += 1
+            return self._remember(key, value)
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        value = self._remember(key, tuple(np.array(a) for a in value))
+        if self.directory is not None:
+            np.savez(self._path(key), *value)
+            self._trim_disk()
+        return value
+
+    def get_or_compute(self, func, matrix, **params):
+        """Return ``func(matrix, **params)``, computing it only on a cache miss."""
+        key = array_digest(matrix, func=func.__qualname__, cache_format=CACHE_FORMAT,
+                           **params)
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, func(matrix, **params))
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self._size = 0
+
+    def _remember(self, key, value):
+        for array in value:
+            array.flags.writeable = False
+        size = sum(a.nbytes for a in value)
+        if size > self.max_bytes:
+            return value
+        if key in self._entries:
+            self._size -= sum(a.nbytes for a in self._entries.pop(key))
+        self._entries[key] = value
+        self._size += size
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= sum(a.nbytes for a in evicted)
+        return value
+
+    def _trim_disk(self):
+        files = [os.path.join(self.directory, f) for f in os.listdir(self.directory)
+                 if f.endswith('.npz')]
+        files.sort(key=os.path.getmtime)
+        sizes = [os.path.getsize(f) for f in files]
+        total = sum(sizes)
+        for path, size in zip(files, sizes):
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(path)
+            total -= size
@@ -0,0 +1,149 @@
+"""K-fold evaluation of PCA + linear regression on SalePrice.
+
+The rows are shuffled once into a single array with SalePrice as its last
+column; every fold is a contiguous slice (a view) of that array.  Training
+statistics are never materialised as a separate copy: the moments of the
+training rows are the moments of the whole array minus those of the held-out
+slice, and scaling, covariance, eigendecomposition and the regression on the
+components all follow from those moments.
+
+Missing predictor values are filled inside each fold with the medians of its
+training rows, so the held-out rows never inform their own fill.  Missing
+entries are stored as zeros next to one indicator column per incomplete
+predictor; the filled moments are a linear map of those moments, so the
+subtraction trick still applies.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .decomposition import covariance_eig
+from .moments import Moments
+from .seeding import make_rng
+
+
+@dataclass
+class CrossValidationResult:
+    """Per-fold RMSE for each number of components, and time spent per fold."""
+
+    rmse: pd.DataFrame
+    fold_seconds: pd.Series
+
+    def summary(self):
+        return pd.DataFrame({'mean_rmse': self.rmse.mean(axis=0),
+                             'std_rmse': self.rmse.std(axis=0)})
+
+
+def _fold_bounds(n_rows, n_splits):
+    sizes = np.full(n_splits, n_rows // n_splits)
+    sizes[:n_rows % n_splits] += 1
+    stops = np.cumsum(sizes)
+    return list(zip(stops - sizes, stops))
+
+
+def _fill_map(n_columns, missing_columns, fills):
+    """Matrix taking ``[values with NaN as 0, missing indicators]`` to filled rows."""
+    fill_map = np.zeros((n_columns + len(missing_columns), n_columns))
+    fill_map[:n_columns] = np.eye(n_columns)
+    fill_map[n_columns + np.arange(len(missing_columns)), missing_columns] = fills
+    return fill_map
+
+
+def _fit_and_score(train, test, max_components):
+    """Fit scaler, PCA and regression from training moments; score a test view."""
+    p = train.n_features - 1
+    mean = train.mean
+    scale = train.std(ddof=0)[:p]
+    cov = train.covariance(ddof=1)
+
+    std_cov = cov[:p, :p] / np.outer(scale, scale)
+    eig_val, eig_vec = covariance_eig(std_cov, max_components)
+
+    # Component scores are centred with variance eig_val, so the OLS slope on
+    # each component is cov(score, y) / var(score) and the intercept is mean(y).
+    cov_score_y = eig_vec.T @ (cov[:p, p] / scale)
+    safe_val = np.where(eig_val > 1e-12, eig_val, np.inf)
+    beta = cov_score_y / safe_val
+
+    scores = ((test[:, :p] - mean[:p]) / scale) @ eig_vec
+    predictions = mean[p] + np.cumsum(scores * beta, axis=1)
+    residuals = predictions - test[:, p:p + 1]
+    return np.sqrt(np.mean(residuals ** 2, axis=0))
+
+
+def kfold_pca_regression(X, y, max_components=5, n_splits=5, n_jobs=None,
+                         random_state=None):
+    """Cross-validate SalePrice regression on the first 1..max_components PCs.
+
+    Parameters
+    ----------
+    X : array-like of shape (n_samples, n_features)
+        Numeric predictors before scaling (``df_num``).  NaNs are filled per
+        fold with the training-fold median, so pass the median-filled columns
+        (e.g. LotFrontage) unfilled to keep the fill out of the held-out rows.
+    y : array-like of shape (n_samples,)
+        Target, e.g. ``raw_data['SalePrice']``.
+    max_components : int
+        RMSE is reported for every component count from 1 to this value.
+    n_splits : int
+        Number of folds.
+    n_jobs : int, optional
+        Worker threads; NumPy releases the GIL so folds run concurrently
+        while sharing the same array.  Defaults to ``n_splits``.
+    random_state : int, optional
+        Seed of the single row shuffle; None uses ``DEFAULT_SEED``.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if X.ndim != 2 or y.shape != (X.shape[0],):
+        raise ValueError('X must be 2-D and y must have one value per row of X')
+    if not 2 <= n_splits <= X.shape[0]:
+        raise ValueError('n_splits must be between 2 and the number of rows')
+    if np.isnan(y).any():
+        raise ValueError('y must not contain NaN')
+    max_components = min(max_components, X.shape[1])
+
+    order = make_rng(random_state).permutation(X.shape[0])
+    n_columns = X.shape[1] + 1
+    missing_columns = np.flatnonzero(np.isnan(X).any(axis=0))
+    incomplete = X[order[:, None], missing_columns]
+    data = np.empty((X.shape[0], n_columns + len(missing_columns)))
+    data[:, :X.shape[1]] = X[order]
+    data[:, X.shape[1]] = y[order]
+    data[:, n_columns:] = np.isnan(incomplete)
+    np.nan_to_num(data, copy=False, nan=0.0)
+    bounds = _fold_bounds(len(data), n_splits)
+    folds = [data[start:stop] for start, stop in bounds]
+
+    def fold_moments(view):
+        start = time.perf_counter()
+        return Moments.from_array(view), time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=n_jobs or n_splits) as pool:
+        stats = list(pool.map(fold_moments, folds))
+        total = sum((m for m, _ in stats), Moments.zeros(data.shape[1]))
+
+        def fold_score(i):
+            start = time.perf_counter()
+            train, test = total - stats[i][0], folds[i]
+            if len(missing_columns):
+                held_out = slice(*bounds[i])
+                fills = np.nanmedian(np.delete(incomplete, held_out, axis=0), axis=0)
+                fill_map = _fill_map(n_columns, missing_columns, fills)
+                train = Moments(train.count, fill_map.T @ train.total,
+                                fill_map.T @ train.cross @ fill_map)
+                test = test @ fill_map
+            rmse = _fit_and_score(train, test, max_components)
+            return rmse, stats[i][1] + time.perf_counter() - start
+
+        scored = list(pool.map(fold_score, range(n_splits)))
+
+    components = pd.Index(range(1, max_components + 1), name='n_components')
+    fold_index = pd.RangeIndex(n_splits, name='fold')
+    rmse = pd.DataFrame([r for r, _ in scored], index=fold_index, columns=components)
+    seconds = pd.Series([s for _, s in scored], index=fold_index, name='seconds')
+    return CrossValidationResult(rmse, seconds)
@@ -0,0 +1,105 @@
+"""Eigendecomposition of covariance matrices.
+
+Every backend returns eigenpairs through ``canonicalize``: eigenvalues in
+descending order and each eigenvector signed so that its largest-magnitude
+entry is positive.  ``eig``, ``eigh``, SVD-based solvers and iterative
+refreshes can each return ``v`` or ``-v``; after canonicalization they agree,
+so projected scores stay valid across refits, processes and libraries.
+"""
+
+import numpy as np
+
+from .seeding import make_rng
+
+
+def canonicalize(eig_val, eig_vec):
+    """Sort eigenpairs by decreasing eigenvalue and fix each vector's sign."""
+    eig_val = np.asarray(eig_val)
+    eig_vec = np.asarray(eig_vec)
+    order = np.argsort(-eig_val, kind='stable')
+    return eig_val[order], align_signs(eig_vec[:, order])
+
+
+def align_signs(vectors):
+    """Flip each column so its largest-magnitude entry is positive.
+
+    The first entry within round-off of the largest magnitude is used, so
+    that exact ties (e.g. YearBuilt and Buiding_age) do not flip signs
+    between fits.
+    """
+    vectors = np.asarray(vectors)
+    magnitude = np.abs(vectors)
+    pivot = np.argmax(magnitude >= magnitude.max(axis=0) * (1 - 1e-6), axis=0)
+    signs = np.sign(vectors[pivot, np.arange(vectors.shape[1])])
+    signs[signs == 0] = 1.0
+    return vectors * signs
+
+
+def canonicalize_sklearn_pca(pca):
+    """Apply the same sign convention in place to a fitted ``sklearn`` PCA."""
+    _, components = canonicalize(pca.explained_variance_, pca.components_.T)
+    pca.components_ = np.ascontiguousarray(components.T)
+    return pca
+
+
+def covariance_eig(cov_mat, n_components=None, cache=None):
+    """Eigenvalues and eigenvectors of a symmetric matrix, largest first.
+
+    ``np.linalg.eig`` returns the pairs in no particular order and may return
+    complex dtypes for round-off asymmetric input; ``eigh`` is the right
+    solver for a covariance matrix and the result is canonicalized here so
+    that ``eig_vec[:, 0:k]`` are the leading components with stable signs.
+
+    Passing a ``DecompositionCache`` returns stored (read-only) eigenpairs
+    when the same matrix and ``n_components`` were decomposed before.
+    """
+    if cache is not None:
+        return cache.get_or_compute(covariance_eig, cov_mat, n_components=n_components)
+    eig_val, eig_vec = np.linalg.eigh(np.asarray(cov_mat, dtype=np.float64))
+    eig_val, eig_vec = canonicalize(eig_val, eig_vec)
+    return eig_val[:n_components], eig_vec[:, :n_components]
+
+
+def data_eig(X, n_components=None, cache=None):
+    """Eigenpairs of ``np.cov(X.T)``; with a cache, neither step is repeated."""
+    if cache is not None:
+        return cache.get_or_compute(data_eig, X, n_components=n_components)
+    return covariance_eig(np.cov(np.asarray(X, dtype=np.float64).T), n_components)
+
+
+def refresh_eig(cov_mat, eig_vec, tol=1e-8, max_iter=100, oversample=None,
+                random_state=None, return_n_iter=False):
+    """Leading eigenpairs of a slightly changed matrix, warm-started.
+
+    Block subspace iteration with Rayleigh-Ritz projection, started from the
+    previously stored ``eig_vec`` (n_features, k) plus ``oversample`` random
+    guard vectors that speed up convergence when eigenvalues are close.  Each
+    iteration is one (n_features x n_features) by (n_features x block) product
+    and a QR of the block, instead of the O(n_features^3) full solve, and a
+    small covariance change typically converges within a few iterations.
+    Iteration stops when every Ritz residual ``||C x - theta x||`` falls below
+    ``tol`` times the largest eigenvalue.
+    """
+    cov_mat = np.asarray(cov_mat, dtype=np.float64)
+    eig_vec = np.asarray(eig_vec, dtype=np.float64)
+    n_features, k = eig_vec.shape
+    if oversample is None:
+        oversample = 2 * k
+    block = min(n_features, k + oversample)
+    guards = make_rng(random_state).standard_normal((n_features, block - k))
+    basis, _ = np.linalg.qr(np.hstack([eig_vec, guards]))
+
+    for n_iter in range(1, max_iter + 1):
+        product = cov_mat @ basis
+        ritz_val, ritz_vec = np.linalg.eigh(basis.T @ product)
+        order = np.argsort(ritz_val)[::-1]
+        ritz_val, ritz_vec = ritz_val[order], ritz_vec[:, order]
+        vectors = basis @ ritz_vec
+        product = product @ ritz_vec
+        residual = np.linalg.norm(product[:, :k] - vectors[:, :k] * ritz_val[:k], axis=0)
+        if residual.max() <= tol * max(abs(ritz_val[0]), 1e-300):
+            break
+        basis, _ = np.linalg.qr(product)
+
+    result = canonicalize(ritz_val[:k], vectors[:, :k])
+    return result + (n_iter,) if return_n_iter else result
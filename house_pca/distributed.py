@@ -0,0 +1,89 @@
+"""Map-reduce PCA fit over CSV shards.
+
+Map: each worker streams its shards and returns the additive ``Moments``
+(row count, column sums, cross-product matrix) of the prepared numeric
+columns.  Reduce: the coordinator adds the moments, derives the
+StandardScaler mean/scale and the standardized covariance, and runs the
+eigendecomposition.  Only p + p^2 numbers per worker cross the network, and
+the result equals a single-machine fit on the concatenated shards.
+
+``fit_distributed`` uses a local process pool as the stand-in for remote
+workers; any ``map``-style executor (for example a cluster client's) can be
+passed instead, and ``Moments.save`` / ``Moments.load`` move partial results
+between machines as files.
+"""
+
+from dataclasses import dataclass
+from functools import partial, reduce
+from multiprocessing import Pool
+
+import numpy as np
+
+from .decomposition import covariance_eig
+from .io import read_chunks
+from .moments import Moments
+
+
+@dataclass
+class DistributedPCAResult:
+    """Merged scaler statistics and leading eigenpairs."""
+
+    columns: list
+    n_rows: int
+    mean: np.ndarray
+    scale: np.ndarray
+    eig_val: np.ndarray
+    eig_vec: np.ndarray
+
+    def transform(self, X):
+        return ((np.asarray(X, dtype=np.float64) - self.mean) / self.scale) @ self.eig_vec
+
+
+def complete_rows(chunk, columns):
+    """Default preparation: the requested columns of rows that have all of them."""
+    return chunk[columns].dropna().to_numpy(dtype=np.float64)
+
+
+def shard_moments(path, columns, prepare=complete_rows, chunksize=100_000,
+                  read_csv_kwargs=None):
+    """Worker step: moments of one CSV shard, read in chunks."""
+    moments = Moments.zeros(len(columns))
+    for chunk in read_chunks(path, chunksize, **(read_csv_kwargs or {})):
+        moments = moments + Moments.from_array(prepare(chunk, columns))
+    return moments
+
+
+def fit_from_moments(moments, columns, n_components=5):
+    """Coordinator step: eigenpairs of the standardized covariance."""
+    eig_val, eig_vec = covariance_eig(moments.standardized_covariance(), n_components)
+    return DistributedPCAResult(list(columns), int(moments.count), moments.mean,
+                                moments.std(ddof=0), eig_val, eig_vec)
+
+
+def fit_distributed(paths, columns, n_components=5, processes=None, mapper=None,
+                    **shard_kwargs):
+    """Fit PCA over many CSV shards.
+
+    Parameters
+    ----------
+    paths : list of str
+        One entry per shard.
+    columns : list of str
+        Numeric columns to decompose; every shard must contain them.
+    processes : int, optional
+        Size of the local worker pool when ``mapper`` is not given.
+    mapper : callable, optional
+        ``map``-like function used to dispatch shards to workers.
+    **shard_kwargs
+        Forwarded to ``shard_moments`` (``prepare``, ``chunksize``,
+        ``read_csv_kwargs``); ``prepare`` must be picklable.
+    """
+    columns = list(columns)
+    work = partial(shard_moments, columns=columns, **shard_kwargs)
+    if mapper is None:
+        with Pool(processes) as pool:
+            partials = pool.map(work, paths)
+    else:
+        partials = list(mapper(work, paths))
+    merged = reduce(lambda a, b: a + b, partials, Moments.zeros(len(columns)))
+    return fit_from_moments(merged, columns, n_components)
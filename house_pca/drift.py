@@ -0,0 +1,167 @@
+"""Streaming check that the fitted components still describe incoming listings.
+
+Each batch is standardized with the fitted scaler and folded into
+exponentially weighted statistics whose half-life is counted in rows.  All
+per-batch work is products with (n_features, k) matrices, so an update costs
+O(batch x features x k), with no covariance matrix and no eigendecomposition:
+
+* the mean of the standardized rows (mean shift, in fitted standard deviations),
+* the total variance and the variance along the fitted components, whose ratio
+  is compared with the explained-variance share at fit time,
+* a tracked k-dimensional principal subspace, updated by one block power
+  (Oja) step per batch, compared with the fitted components through their
+  principal angles.
+
+``update`` returns the alerts raised by a batch; a refit is due only when
+one fires.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class DriftAlert:
+    """A monitored statistic that crossed its threshold."""
+
+    rows_seen: int
+    metric: str
+    value: float
+    threshold: float
+    detail: str = ''
+
+
+class DriftMonitor:
+    """Exponentially weighted drift statistics of a stream against a fitted PCA.
+
+    Parameters
+    ----------
+    eig_vec : ndarray of shape (n_features, k)
+        Fitted components.
+    eig_val : ndarray of shape (k,)
+        Their eigenvalues.
+    mean, scale : ndarray of shape (n_features,), optional
+        Scaler statistics applied to raw rows; omit for standardized input.
+    total_variance : float, optional
+        Trace of the fitted covariance; defaults to ``n_features``.
+    features : list of str, optional
+        Names used in mean-shift alerts.
+    halflife : int
+        Rows after which a batch's weight has halved.
+    min_rows : int
+        Rows to see before any alert is raised.
+    max_angle : float
+        Largest principal angle, in degrees, between fitted and tracked subspaces.
+    max_variance_shift : float
+        Largest change in the share of variance the fitted components explain.
+    max_mean_shift : float
+        Largest drift of a feature mean, in fitted standard deviations.
+    """
+
+    def __init__(self, eig_vec, eig_val, mean=None, scale=None, total_variance=None,
+                 features=None, halflife=20_000, min_rows=5_000, max_angle=15.0,
+                 max_variance_shift=0.05, max_mean_shift=0.5):
+        eig_vec = np.asarray(eig_vec, dtype=np.float64)
+        n_features = eig_vec.shape[0]
+        self.eig_vec = eig_vec
+        self.mean = np.zeros(n_features) if mean is None else np.asarray(mean, dtype=np.float64)
+        self.scale = np.ones(n_features) if scale is None else np.asarray(scale, dtype=np.float64)
+        total = n_features if total_variance is None else total_variance
+        self.reference_ratio = float(np.sum(eig_val) / total)
+        self.features = list(range(n_features)) if features is None else list(features)
+        self.halflife = halflife
+        self.min_rows = min_rows
+        self.max_angle = max_angle
+        self.max_variance_shift = max_variance_shift
+        self.max_mean_shift = max_mean_shift
+
+        self.rows_seen = 0
+        self.history = []
+        self._first = np.zeros(n_features)
+        self._square = 0.0
+        self._fitted_first = np.zeros(eig_vec.shape[1])
+        self._fitted_square = np.zeros(eig_vec.shape[1])
+        self._basis = eig_vec.copy()
+        self._product = eig_vec * np.asarray(eig_val, dtype=np.float64)
+        self._tracked = np.asarray(eig_val, dtype=np.float64).copy()
+
+    def _blend(self, old, new, keep):
+        return keep * old + (1.0 - keep) * new
+
+    def update(self, batch):
+        """Fold one batch of rows into the statistics; returns the alerts it raises."""
+        X = np.asarray(batch, dtype=np.float64)
+        n = len(X)
+        if n == 0:
+            return []
+        keep = 0.5 ** (n / self.halflife) if self.rows_seen else 0.0
+        k = self.eig_vec.shape[1]
+        # The scaler is folded into every product, so the standardized batch
+        # z = (X - mean) / scale is never materialized.
+        weights = np.hstack([self.eig_vec, self._basis]) / self.scale[:, None]
+        both = X @ weights
+        both -= self.mean @ weights
+        scores, tracked = both[:, :k], both[:, k:]
+        column_sum = X.sum(axis=0)
+        batch_mean = (column_sum / n - self.mean) / self.scale
+        square = np.sum((np.einsum('ij,ij->j', X, X) - 2 * self.mean * column_sum
+                         + n * self.mean ** 2) / self.scale ** 2) / n
+
+        self._first = self._blend(self._first, batch_mean, keep)
+        self._square = self._blend(self._square, square, keep)
+        self._fitted_first = self._blend(self._fitted_first, scores.mean(axis=0), keep)
+        self._fitted_square = self._blend(self._fitted_square,
+                                          np.einsum('ij,ij->j', scores, scores) / n, keep)
+
+        # Block power step on the weighted covariance, applied to the tracked basis
+        # only: (z - m)^T (z - m) U / n expanded so that z is never re-centred.
+        m = self._first
+        m_u = m @ self._basis
+        tracked_sum = tracked.sum(axis=0)
+        z_t = (X.T @ tracked - np.outer(self.mean, tracked_sum)) / self.scale[:, None]
+        product = (z_t / n - np.outer(batch_mean, m_u)
+                   - np.outer(m, tracked_sum / n) + np.outer(m, m_u))
+        self._product = self._blend(self._product, product, keep)
+        self._basis, r = np.linalg.qr(self._product)
+        signs = np.where(np.diag(r) < 0, -1.0, 1.0)
+        self._basis *= signs
+        # At convergence product = basis @ diag(variances), so R's diagonal holds them.
+        self._tracked = np.diag(r) * signs
+        self.rows_seen += n
+
+        status = self.status()
+        self.history.append(status)
+        return self._alerts(status)
+
+    def status(self):
+        """Current drift statistics as a dict."""
+        total = self._square - self._first @ self._first
+        fitted = np.sum(self._fitted_square - self._fitted_first ** 2)
+        tracked = np.sum(self._tracked)
+        cosines = np.linalg.svd(self.eig_vec.T @ self._basis, compute_uv=False)
+        angles = np.degrees(np.arccos(np.clip(cosines, -1.0, 1.0)))
+        worst = int(np.argmax(np.abs(self._first)))
+        return {'rows_seen': self.rows_seen,
+                'max_angle': float(angles.max()),
+                'explained_ratio': float(fitted / total),
+                'tracked_ratio': float(tracked / total),
+                'variance_shift': float(fitted / total - self.reference_ratio),
+                'mean_shift': float(abs(self._first[worst])),
+                'mean_shift_feature': self.features[worst]}
+
+    def _alerts(self, status):
+        if self.rows_seen < self.min_rows:
+            return []
+        checks = [('max_angle', status['max_angle'], self.max_angle, ''),
+                  ('variance_shift', abs(status['variance_shift']),
+                   self.max_variance_shift, ''),
+                  ('mean_shift', status['mean_shift'], self.max_mean_shift,
+                   str(status['mean_shift_feature']))]
+        return [DriftAlert(self.rows_seen, metric, value, threshold, detail)
+                for metric, value, threshold, detail in checks if value > threshold]
+
+    def report(self):
+        """History of ``status`` after every batch, as a DataFrame."""
+        return pd.DataFrame(self.history).set_index('rows_seen')
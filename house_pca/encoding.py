@@ -0,0 +1,47 @@
+"""Ordinal encoding of the quality scales so they can enter the PCA.
+
+ExterQual, KitchenQual, BsmtQual, GarageQual, FireplaceQu, PoolQC and the
+other condition columns share the scale Po < Fa < TA < Gd < Ex, with the
+"No Basement" / "No Garage" / ... fills from cleaning ranked below Po.
+Each column is encoded in one vectorized step: text columns through an index
+lookup against the declared levels, categorical columns through a level
+lookup table gathered by their existing codes.
+"""
+
+import numpy as np
+import pandas as pd
+
+QUALITY_SCALE = ('Po', 'Fa', 'TA', 'Gd', 'Ex')
+
+# Column -> levels in increasing order; the code is the position in the tuple.
+ORDINAL_LEVELS = {
+    'ExterQual': ('None',) + QUALITY_SCALE,
+    'ExterCond': ('None',) + QUALITY_SCALE,
+    'HeatingQC': ('None',) + QUALITY_SCALE,
+    'KitchenQual': ('None',) + QUALITY_SCALE,
+    'BsmtQual': ('No Basement',) + QUALITY_SCALE,
+    'BsmtCond': ('No Basement',) + QUALITY_SCALE,
+    'FireplaceQu': ('No Fireplace',) + QUALITY_SCALE,
+    'GarageQual': ('No Garage',) + QUALITY_SCALE,
+    'GarageCond': ('No Garage',) + QUALITY_SCALE,
+    'PoolQC': ('No Pool',) + QUALITY_SCALE,
+}
+
+
+def ordinal_codes(series, levels):
+    """Codes of ``series`` in ``levels``; NaN for missing or undeclared values."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        lookup = pd.Index(levels).get_indexer(series.cat.categories)
+        codes = np.append(lookup, -1)[series.cat.codes.to_numpy()]
+    else:
+        codes = pd.Index(levels).get_indexer(series)
+    if (codes < 0).any():
+        return pd.Series(np.where(codes < 0, np.nan, codes), index=series.index)
+    return pd.Series(codes.astype(np.int8), index=series.index)
+
+
+def encode_ordinal(frame, levels=ORDINAL_LEVELS):
+    """Return ``frame`` with every column named in ``levels`` replaced by its codes."""
+    encoded = {column: ordinal_codes(frame[column], column_levels)
+               for column, column_levels in levels.items() if column in frame.columns}
+    return frame.assign(**encoded)
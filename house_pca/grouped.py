@@ -0,0 +1,182 @@
+"""Independent scaler + PCA fits per market segment (Neighborhood, MSZoning, ...).
+
+Rows are partitioned with one ``factorize`` + stable ``argsort`` pass, so
+each group is a contiguous block of a single reordered array.  Blocks are
+packed into tasks of at least ``batch_rows`` rows, so that a pool worker
+fits several small neighbourhoods in one round trip.  Each worker returns
+the group's ``Moments`` and its fit.  Groups with fewer than ``min_rows``
+rows are not fitted on their own: they fall back to a pooled model fitted
+from the sum of all group moments, without another pass over the rows.
+
+All models are stacked into one ``GroupedPCAModel`` (arrays indexed by
+group, plus the pooled model in the last slot).  At transform time, rows are
+routed to their slot by one index lookup and projected one group block at a
+time.
+"""
+
+from dataclasses import dataclass
+from functools import partial, reduce
+from multiprocessing import Pool
+
+import numpy as np
+import pandas as pd
+
+from .distributed import fit_from_moments
+from .moments import Moments
+
+
+@dataclass
+class GroupedPCAModel:
+    """Stacked per-group models; slot ``len(keys)`` is the pooled fallback.
+
+    ``mean`` and ``scale`` have shape (n_groups + 1, n_features),
+    ``eig_val`` (n_groups + 1, k) and ``eig_vec`` (n_groups + 1, n_features, k);
+    ``total_variance`` is the trace of each standardized covariance.
+    """
+
+    keys: np.ndarray
+    columns: list
+    n_rows: np.ndarray
+    total_variance: np.ndarray
+    mean: np.ndarray
+    scale: np.ndarray
+    eig_val: np.ndarray
+    eig_vec: np.ndarray
+
+    def route(self, groups):
+        """Model slot of each row; unknown or unfitted groups get the pooled slot."""
+        slots = pd.Index(self.keys).get_indexer(np.asarray(groups, dtype=object))
+        slots[slots < 0] = len(self.keys)
+        return slots
+
+    def transform(self, X, groups):
+        """Scores of each row under its group's model."""
+        X = np.asarray(X, dtype=np.float64)
+        slots = self.route(groups)
+        order = np.argsort(slots, kind='stable')
+        bounds = np.searchsorted(slots[order], np.arange(len(self.keys) + 2))
+        # Scaling folded into the components, as in ``AffineProjection``.
+        weight = self.eig_vec / self.scale[:, :, None]
+        bias = -np.einsum('gp,gpk->gk', self.mean, weight)
+        out = np.empty((len(X), self.eig_vec.shape[2]))
+        for slot, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])):
+            if start == stop:
+                continue
+            rows = order[start:stop]
+            out[rows] = X[rows] @ weight[slot] + bias[slot]
+        return out
+
+    def group_summary(self):
+        """Rows and explained-variance share of the kept components, per group."""
+        index = pd.Index([*self.keys, '(pooled)'], name='group')
+        explained = self.eig_val.sum(axis=1) / self.total_variance
+        return pd.DataFrame({'rows': self.n_rows, 'explained': explained}, index=index)
+
+    def save(self, path):
+        """Write every group model to one ``.npz`` artifact.
+
+        Keys keep their type: integer, float and boolean keys (e.g.
+        ``MSSubClass``) are stored as numbers, everything else as strings.
+        """
+        keys = pd.Index(list(self.keys))
+        if keys.inferred_type in ('integer', 'floating', 'boolean'):
+            keys = keys.to_numpy()
+        elif keys.inferred_type in ('string', 'empty'):
+            keys = keys.to_numpy(dtype=str)
+        else:
+            raise TypeError(f'cannot store group keys of mixed type ({keys.inferred_type})')
+        np.savez(path, keys=keys, columns=np.array(self.columns),
+                 n_rows=self.n_rows, total_variance=self.total_variance, mean=self.mean,
+                 scale=self.scale, eig_val=self.eig_val, eig_vec=self.eig_vec)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as stored:
+            return cls(stored['keys'].astype(object), stored['columns'].tolist(),
+                       stored['n_rows'], stored['total_variance'], stored['mean'],
+                       stored['scale'], stored['eig_val'], stored['eig_vec'])
+
+
+def _pack(bounds, batch_rows):
+    """Consecutive group positions packed into tasks of at least ``batch_rows`` rows."""
+    tasks, current, size = [], [], 0
+    for group, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])):
+        current.append(group)
+        size += stop - start
+        if size >= batch_rows:
+            tasks.append(current)
+            current, size = [], 0
+    if current:
+        tasks.append(current)
+    return tasks
+
+
+def _fit_blocks(blocks, columns, n_components, min_rows):
+    """Worker step: moments of each block, and its fit when it is large enough."""
+    results = []
+    for block in blocks:
+        moments = Moments.from_array(block)
+        fit = fit_from_moments(moments, columns, n_components) if len(block) >= min_rows else None
+        results.append((moments, fit))
+    return results
+
+
+def fit_grouped(X, groups, n_components=5, min_rows=None, batch_rows=50_000,
+                processes=None, mapper=None):
+    """Fit one standardized PCA per group.
+
+    Parameters
+    ----------
+    X : DataFrame or array of shape (n_rows, n_features)
+        Numeric features, e.g. ``numeric_features(pipeline.engineer())``.
+    groups : array-like of shape (n_rows,)
+        Group key per row, e.g. ``data['Neighborhood']``; missing keys only
+        contribute to the pooled model.
+    n_components : int
+        Components kept per group.
+    min_rows : int, optional
+        Smallest group fitted on its own; defaults to ``n_features + 1`` so
+        every group covariance can be full rank.
+    batch_rows : int
+        Minimum rows per worker task; small groups share a task.
+    processes : int, optional
+        Size of the local pool; 1 fits in-process.
+    mapper : callable, optional
+        ``map``-like function used instead of the local pool.
+    """
+    columns = list(X.columns) if isinstance(X, pd.DataFrame) else list(range(X.shape[1]))
+    X = np.asarray(X, dtype=np.float64)
+    min_rows = X.shape[1] + 1 if min_rows is None else min_rows
+
+    codes, keys = pd.factorize(np.asarray(groups, dtype=object), sort=True)
+    order = np.argsort(codes, kind='stable')
+    n_missing = int(np.count_nonzero(codes < 0))
+    ordered = X[order[n_missing:]]
+    bounds = np.concatenate([[0], np.cumsum(np.bincount(codes[codes >= 0],
+                                                        minlength=len(keys)))])
+
+    tasks = [[ordered[bounds[g]:bounds[g + 1]] for g in task]
+             for task in _pack(bounds, batch_rows)]
+    work = partial(_fit_blocks, columns=columns, n_components=n_components,
+                   min_rows=min_rows)
+    if mapper is None and processes == 1:
+        mapper = map
+    if mapper is None:
+        with Pool(processes) as pool:
+            results = pool.map(work, tasks)
+    else:
+        results = list(mapper(work, tasks))
+    results = [result for task in results for result in task]
+
+    pooled = reduce(lambda a, b: a + b, [m for m, _ in results],
+                    Moments.from_array(X[order[:n_missing]]))
+    fitted = [(key, m, fit) for key, (m, fit) in zip(keys, results) if fit is not None]
+    fits = [fit for _, _, fit in fitted] + [fit_from_moments(pooled, columns, n_components)]
+    moments = [m for _, m, _ in fitted] + [pooled]
+    return GroupedPCAModel(np.array([key for key, _, _ in fitted], dtype=object), columns,
+                           np.array([fit.n_rows for fit in fits]),
+                           np.array([np.trace(m.standardized_covariance()) for m in moments]),
+                           np.stack([fit.mean for fit in fits]),
+                           np.stack([fit.scale for fit in fits]),
+                           np.stack([fit.eig_val for fit in fits]),
+                           np.stack([fit.eig_vec for fit in fits]))
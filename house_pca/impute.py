@@ -0,0 +1,120 @@
+"""Median, quantile and mode imputation learned in one streaming pass.
+
+``raw_data['LotFrontage'].fillna(raw_data['LotFrontage'].median())`` needs
+the whole column in memory.  ``SketchImputer`` instead folds chunks (or
+shards fitted elsewhere and merged) into per-column sketches, and keeps the
+sketches themselves as its fitted state so the fill values can be
+re-derived, refined with more data or shipped as JSON.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+
+from .sketches import FrequentItemsSketch, QuantileSketch
+
+STRATEGIES = ('median', 'quantile', 'most_frequent')
+
+
+class SketchImputer(TransformerMixin, BaseEstimator):
+    """Fill missing values from mergeable per-column sketches.
+
+    Parameters
+    ----------
+    strategy : {'median', 'quantile', 'most_frequent'}
+        Statistic used as fill value.
+    quantile : float
+        Quantile used when ``strategy='quantile'``.
+    columns : list of str, optional
+        Columns to learn and fill; defaults to the numeric columns of the
+        first chunk for median/quantile and to all of its columns for
+        ``most_frequent``.
+    compression : int
+        t-digest size for median/quantile; higher is more accurate.
+    capacity : int
+        Counters kept per column for ``most_frequent``.
+    """
+
+    def __init__(self, strategy='median', quantile=0.5, columns=None,
+                 compression=200, capacity=64):
+        self.strategy = strategy
+        self.quantile = quantile
+        self.columns = columns
+        self.compression = compression
+        self.capacity = capacity
+
+    def _new_sketch(self):
+        if self.strategy == 'most_frequent':
+            return FrequentItemsSketch(self.capacity)
+        return QuantileSketch(self.compression)
+
+    def partial_fit(self, X, y=None):
+        """Fold one chunk into the sketches."""
+        if self.strategy not in STRATEGIES:
+            raise ValueError(f'strategy must be one of {STRATEGIES}, got {self.strategy!r}')
+        X = pd.DataFrame(X)
+        numeric_only = self.strategy != 'most_frequent'
+        if not hasattr(self, 'sketches_'):
+            if self.columns is not None:
+                columns = list(self.columns)
+            elif numeric_only:
+                columns = list(X.select_dtypes('number').columns)
+            else:
+                columns = list(X.columns)
+            self.sketches_ = {column: self._new_sketch() for column in columns}
+        if numeric_only:
+            # A column that was all NaN in the first chunk may turn out to be text.
+            text = [column for column in self.sketches_
+                    if not pd.api.types.is_numeric_dtype(X[column].dtype)
+                    and X[column].notna().any()]
+            if text:
+                raise ValueError(f'strategy={self.strategy!r} needs numeric columns; '
+                                 f'got text in {text}')
+        for column, sketch in self.sketches_.items():
+            sketch.update(X[column])
+        return self
+
+    def fit(self, X, y=None):
+        if hasattr(self, 'sketches_'):
+            del self.sketches_
+        return self.partial_fit(X)
+
+    def fit_chunks(self, chunks):
+        """Fit from an iterable of DataFrames, e.g. ``read_chunks(path)``."""
+        if hasattr(self, 'sketches_'):
+            del self.sketches_
+        for chunk in chunks:
+            self.partial_fit(chunk)
+        return self
+
+    def merge(self, other):
+        """Combine with an imputer fitted on another shard of the data."""
+        for column, sketch in other.sketches_.items():
+            self.sketches_[column].merge(sketch)
+        return self
+
+    @property
+    def statistics_(self):
+        if self.strategy == 'most_frequent':
+            values = {c: s.most_frequent() for c, s in self.sketches_.items()}
+        else:
+            q = 0.5 if self.strategy == 'median' else self.quantile
+            values = {c: s.quantile(q) for c, s in self.sketches_.items()}
+        return pd.Series(values, dtype=object if self.strategy == 'most_frequent' else np.float64)
+
+    def transform(self, X):
+        X = pd.DataFrame(X)
+        return X.fillna(self.statistics_.to_dict())
+
+    def to_dict(self):
+        params = self.get_params()
+        params['columns'] = list(self.sketches_)
+        return {'params': params,
+                'sketches': {c: s.to_dict() for c, s in self.sketches_.items()}}
+
+    @classmethod
+    def from_dict(cls, state):
+        imputer = cls(**state['params'])
+        sketch_type = FrequentItemsSketch if imputer.strategy == 'most_frequent' else QuantileSketch
+        imputer.sketches_ = {c: sketch_type.from_dict(s) for c, s in state['sketches'].items()}
+        return imputer
@@ -0,0 +1,165 @@
+"""Mini-batch fitting of the scikit-learn PCA path with bounded memory.
+
+``IncrementalHousePCA`` applies the pipeline's clean/engineer steps to each
+raw chunk and fits in two streaming passes:
+
+1. ``partial_fit_stats`` learns the StandardScaler statistics and a t-digest
+   of each median-filled column (O(features) state).  Rows whose median-filled
+   value is missing are accounted for exactly when the pass ends, as if the
+   final median had been filled in all along.
+2. ``partial_fit`` scales each chunk and feeds ``IncrementalPCA``, whose state
+   is a (k + oversample) x features component matrix plus O(features)
+   vectors.  Every update truncates to the retained rank, so with exactly k
+   components the trailing ones drift when the spectrum is flat (PC4/PC5 of
+   the house data); the ``oversample`` extra directions absorb that
+   truncation and the reported components are the leading k.
+
+No state grows with the number of rows.  Components are sign-canonicalized so
+they match the in-memory ``PCA(n_components=5)`` fit.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import IncrementalPCA
+from sklearn.preprocessing import StandardScaler
+
+from .decomposition import canonicalize
+from .encoding import ORDINAL_LEVELS
+from .impute import SketchImputer
+from .pipeline import MEDIAN_FILLS, clean, engineer, numeric_features
+
+
+class IncrementalHousePCA:
+    """Two-pass, mini-batch PCA over raw listing chunks.
+
+    Parameters
+    ----------
+    n_components : int
+        Components to keep.
+    oversample : int
+        Extra components tracked internally; the state stays O(k x features).
+    current_year : int, optional
+        Reference year for the age features.
+    ordinal_levels : dict, optional
+        Quality-scale level map, as in ``HousePricePipeline``.
+    compression : int
+        t-digest size for the median fills.
+    """
+
+    def __init__(self, n_components=5, oversample=10, current_year=None,
+                 ordinal_levels=ORDINAL_LEVELS, compression=200):
+        self.n_components = n_components
+        self.oversample = oversample
+        self.current_year = current_year
+        self.ordinal_levels = ordinal_levels
+        self.compression = compression
+        self.scaler = StandardScaler()
+        self.imputer = SketchImputer('median', compression=compression)
+        self.ipca = None
+        self.n_rows_ = 0
+        self._stats_final = False
+        self._pending = None
+
+    def _features(self, chunk, medians):
+        return numeric_features(engineer(clean(chunk, medians), self.current_year,
+                                         self.ordinal_levels))
+
+    def partial_fit_stats(self, chunk):
+        """First pass: scaler statistics and median sketches from one raw chunk."""
+        if self._stats_final:
+            raise RuntimeError('statistics are final once partial_fit has been called')
+        features = self._features(chunk, medians={})
+        median_columns = [c for c in MEDIAN_FILLS if c in features.columns]
+        self.imputer.set_params(columns=median_columns)
+        self.imputer.partial_fit(features[median_columns])
+        self.scaler.partial_fit(features)
+        self.n_rows_ += len(features)
+        return self
+
+    def _finalize_stats(self):
+        """Fold the median fill of rows skipped as NaN into the scaler."""
+        self.medians_ = self.imputer.statistics_.to_dict()
+        seen = np.broadcast_to(self.scaler.n_samples_seen_, self.scaler.mean_.shape)
+        mean, var = self.scaler.mean_.copy(), self.scaler.var_.copy()
+        columns = list(self.scaler.feature_names_in_)
+        for column, median in self.medians_.items():
+            i = columns.index(column)
+            n_seen, n_fill = seen[i], self.n_rows_ - seen[i]
+            new_mean = (n_seen * mean[i] + n_fill * median) / self.n_rows_
+            var[i] = (n_seen * (var[i] + (mean[i] - new_mean) ** 2)
+                      + n_fill * (median - new_mean) ** 2) / self.n_rows_
+            mean[i] = new_mean
+        scale = np.sqrt(var)
+        scale[scale == 0] = 1.0
+        self.scaler.mean_, self.scaler.var_, self.scaler.scale_ = mean, var, scale
+        self.scaler.n_samples_seen_ = self.n_rows_
+        self.ipca = IncrementalPCA(n_components=min(len(columns),
+                                                    self.n_components + self.oversample))
+        self._stats_final = True
+
+    def _scaled(self, chunk):
+        features = self._features(chunk, self.medians_)
+        return self.scaler.transform(features)
+
+    def partial_fit(self, chunk):
+        """Second pass: update the components with one raw chunk."""
+        if not self._stats_final:
+            self._finalize_stats()
+        scaled = self._scaled(chunk)
+        if self._pending is not None:
+            scaled = np.vstack([self._pending, scaled])
+            self._pending = None
+        # IncrementalPCA needs at least n_components rows for its first update;
+        # later updates take batches of any size.
+        if len(scaled) < self.ipca.n_components and not hasattr(self.ipca, 'components_'):
+            self._pending = scaled
+        else:
+            self.ipca.partial_fit(scaled)
+        return self
+
+    def finalize(self):
+        """Fit rows still held back after the last ``partial_fit``.
+
+        Rows are only held back while fewer than ``n_components + oversample``
+        have been seen in total; they are then fitted with fewer oversampled
+        directions.  ``fit_chunks`` calls this itself.
+        """
+        if self._pending is None:
+            return self
+        n_rows = len(self._pending)
+        if n_rows < self.n_components:
+            raise ValueError(f'{n_rows} rows cannot be fitted with '
+                             f'n_components={self.n_components}')
+        self.ipca = IncrementalPCA(n_components=n_rows).partial_fit(self._pending)
+        self._pending = None
+        return self
+
+    def fit_chunks(self, chunk_source):
+        """Run both passes; ``chunk_source()`` must return a fresh chunk iterator.
+
+        For example ``lambda: read_chunks('houseprice.csv', 10_000, index_col=0)``.
+        """
+        for chunk in chunk_source():
+            self.partial_fit_stats(chunk)
+        for chunk in chunk_source():
+            self.partial_fit(chunk)
+        return self.finalize()
+
+    @property
+    def explained_variance_(self):
+        return self.ipca.explained_variance_[:self.n_components]
+
+    @property
+    def components_(self):
+        """Sign-canonical components, shape (n_components, n_features)."""
+        k = self.n_components
+        _, eig_vec = canonicalize(self.ipca.explained_variance_[:k],
+                                  self.ipca.components_[:k].T)
+        return eig_vec.T
+
+    def transform(self, chunk):
+        """PC scores of a raw chunk, as a DataFrame indexed like the chunk."""
+        features = self._features(chunk, self.medians_)
+        scores = (self.scaler.transform(features) - self.ipca.mean_) @ self.components_.T
+        columns = [f'PC{i + 1}' for i in range(self.n_components)]
+        return pd.DataFrame(scores, index=features.index, columns=columns)
@@ -0,0 +1,180 @@
+"""Reading listing files in bounded-memory chunks.
+
+Compressed feeds (``.gz``, ``.bz2``, ``.xz``, ``.zst``) are decompressed
+ahead of the parser.  With ``decompress='thread'``, a background thread
+reads decompressed blocks into a bounded queue; zlib, bz2, lzma and
+zstandard release the GIL while inflating, so decompression overlaps with
+parsing.  With ``decompress='process'``, an external decompressor (``pigz``,
+``lbzip2``, ``zstd``, ...) runs as a child process and the OS pipe is the
+bounded buffer.  Either way the parser sees a plain byte stream, and at most
+``max_blocks`` decompressed blocks are held in memory.
+"""
+
+import bz2
+import contextlib
+import gzip
+import lzma
+import queue
+import shutil
+import subprocess
+import threading
+from io import RawIOBase
+
+import pandas as pd
+
+COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.zst': 'zstd'}
+# External decompressors, fastest first; each is called as ``tool -dc path``.
+DECOMPRESSORS = {'gzip': ('pigz', 'gzip'), 'bz2': ('lbzip2', 'pbzip2', 'bzip2'),
+                 'xz': ('xz',), 'zstd': ('zstd',)}
+
+
+def infer_compression(path, compression='infer'):
+    """Compression name of ``path`` from its suffix, or None for plain files."""
+    if compression != 'infer':
+        return compression
+    for suffix, name in COMPRESSION_SUFFIXES.items():
+        if str(path).endswith(suffix):
+            return name
+    return None
+
+
+def _open_stdlib(path, compression):
+    if compression == 'gzip':
+        return gzip.open(path, 'rb')
+    if compression == 'bz2':
+        return bz2.open(path, 'rb')
+    if compression == 'xz':
+        return lzma.open(path, 'rb')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ImportError("reading .zst files needs the 'zstandard' package "
+                              "or decompress='process' with the zstd tool") from exc
+        return zstandard.open(path, 'rb')
+    raise ValueError(f'unsupported compression {compression!r}')
+
+
+class _PrefetchStream(RawIOBase):
+    """Read-only byte stream filled by a background decompression thread."""
+
+    def __init__(self, opener, block_size, max_blocks):
+        self._opener = opener
+        self._block_size = block_size
+        self._queue = queue.Queue(max_blocks)
+        self._stop = threading.Event()
+        self._pending = memoryview(b'')
+        self._done = False
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self):
+        try:
+            with self._opener() as source:
+                while not self._stop.is_set():
+                    block = source.read(self._block_size)
+                    if not block or not self._put(block):
+                        break
+        except Exception as exc:  # re-raised in the reading thread
+            self._put(exc)
+        self._put(None)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending and not self._done:
+            item = self._queue.get()
+            if item is None:
+                self._done = True
+            elif isinstance(item, Exception):
+                self._done = True
+                raise item
+            else:
+                self._pending = memoryview(item)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+        super().close()
+
+
+@contextlib.contextmanager
+def open_decompressed(path, compression='infer', decompress='thread', block_size=2 ** 20,
+                      max_blocks=16):
+    """Binary stream of the decompressed content of ``path``.
+
+    Parameters
+    ----------
+    path : str
+        Plain or compressed file.
+    compression : str
+        ``'gzip'``, ``'bz2'``, ``'xz'``, ``'zstd'``, None, or ``'infer'`` from the suffix.
+    decompress : {'thread', 'process', None}
+        Where decompression runs: a background thread, an external tool in a
+        child process, or inline in the reading thread.
+    block_size, max_blocks : int
+        Size and number of decompressed blocks buffered ahead of the reader.
+    """
+    compression = infer_compression(path, compression)
+    if compression is None:
+        with open(path, 'rb') as stream:
+            yield stream
+    elif decompress == 'process':
+        tool = next((t for t in DECOMPRESSORS[compression] if shutil.which(t)), None)
+        if tool is None:
+            raise RuntimeError(f'no decompressor for {compression} found on PATH')
+        process = subprocess.Popen([tool, '-dc', str(path)], stdout=subprocess.PIPE,
+                                   bufsize=block_size)
+        try:
+            yield process.stdout
+        except BaseException:
+            process.terminate()
+            raise
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+        if returncode != 0:
+            raise OSError(f'{tool} exited with status {returncode} while reading {path}')
+    elif decompress == 'thread':
+        stream = _PrefetchStream(lambda: _open_stdlib(path, compression), block_size,
+                                 max_blocks)
+        with stream:
+            yield stream
+    elif decompress is None:
+        with _open_stdlib(path, compression) as stream:
+            yield stream
+    else:
+        raise ValueError(f"decompress must be 'thread', 'process' or None, got {decompress!r}")
+
+
+def read_chunks(path, chunksize=100_000, decompress='thread', **read_csv_kwargs):
+    """Yield DataFrames of at most ``chunksize`` rows from a CSV file.
+
+    Compressed files are decompressed ahead of the parser as described in
+    ``open_decompressed``; ``decompress='pandas'`` leaves it to ``read_csv``.
+    """
+    compression = infer_compression(path, read_csv_kwargs.pop('compression', 'infer'))
+    if compression is None or decompress == 'pandas':
+        with pd.read_csv(path, chunksize=chunksize, compression=compression,
+                         **read_csv_kwargs) as reader:
+            yield from reader
+        return
+    with open_decompressed(path, compression, decompress) as stream:
+        with pd.read_csv(stream, chunksize=chunksize, compression=None,
+                         **read_csv_kwargs) as reader:
+            yield from reader
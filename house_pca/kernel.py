@@ -0,0 +1,97 @@
+"""Kernel PCA through the Nyström approximation.
+
+Exact kernel PCA needs the n x n kernel matrix.  Here the kernel is evaluated
+only against ``n_landmarks`` sampled rows; the Nyström feature map
+``phi(x) = k(x, L) K_LL^{-1/2}`` turns kernel PCA into linear PCA on
+``n_landmarks`` features, whose covariance is accumulated batch by batch.
+Fitting costs O(n m^2) time and O(batch m + m^2) memory, and the fitted
+model folds ``K_LL^{-1/2}`` and the eigenvectors into one m x k matrix so that
+``transform`` is a kernel evaluation against the landmarks plus one GEMM.
+"""
+
+import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.metrics.pairwise import pairwise_kernels
+
+from .decomposition import align_signs, covariance_eig
+from .moments import Moments
+from .seeding import make_rng
+
+
+class NystroemKernelPCA(TransformerMixin, BaseEstimator):
+    """Approximate kernel PCA; drop-in after ``StandardScaler`` in a Pipeline.
+
+    Parameters
+    ----------
+    n_components : int
+        Number of kernel principal components.
+    n_landmarks : int
+        Rows sampled as Nyström landmarks; cost grows with this, not with n.
+    kernel : str
+        Any kernel accepted by ``sklearn.metrics.pairwise.pairwise_kernels``.
+    gamma, degree, coef0 : float, optional
+        Kernel parameters; ``gamma`` defaults to ``1 / n_features``.
+    batch_size : int
+        Rows per kernel block during fit and transform.
+    random_state : int, optional
+        Seed of the landmark sample; None uses ``DEFAULT_SEED``.
+    """
+
+    def __init__(self, n_components=5, n_landmarks=300, kernel='rbf', gamma=None,
+                 degree=3, coef0=1, batch_size=16384, random_state=None):
+        self.n_components = n_components
+        self.n_landmarks = n_landmarks
+        self.kernel = kernel
+        self.gamma = gamma
+        self.degree = degree
+        self.coef0 = coef0
+        self.batch_size = batch_size
+        self.random_state = random_state
+
+    def _kernel(self, X):
+        params = {'gamma': self.gamma_}
+        if self.kernel in ('poly', 'polynomial'):
+            params.update(degree=self.degree, coef0=self.coef0)
+        elif self.kernel == 'sigmoid':
+            params.update(coef0=self.coef0)
+        elif self.kernel not in ('rbf', 'laplacian', 'chi2'):
+            params = {}
+        return pairwise_kernels(X, self.landmarks_, metric=self.kernel, **params)
+
+    def _batches(self, X):
+        for start in range(0, X.shape[0], self.batch_size):
+            yield start, X[start:start + self.batch_size]
+
+    def fit(self, X, y=None):
+        X = np.asarray(X, dtype=np.float64)
+        n_landmarks = min(self.n_landmarks, X.shape[0])
+        rng = make_rng(self.random_state)
+        self.landmarks_ = X[np.sort(rng.choice(X.shape[0], n_landmarks, replace=False))]
+        self.gamma_ = 1.0 / X.shape[1] if self.gamma is None else self.gamma
+
+        # K_LL^{-1/2}, discarding directions the landmarks do not span.
+        k_val, k_vec = np.linalg.eigh(self._kernel(self.landmarks_))
+        keep = k_val > k_val.max() * 1e-10
+        normalization = k_vec[:, keep] / np.sqrt(k_val[keep])
+
+        moments = Moments.zeros(normalization.shape[1])
+        for _, batch in self._batches(X):
+            moments = moments + Moments.from_array(self._kernel(batch) @ normalization)
+
+        eig_val, eig_vec = covariance_eig(moments.covariance(ddof=1), self.n_components)
+        # The signs of ``k_vec`` are arbitrary, so the sign rule is applied to
+        # the weights over the landmarks, whose basis does not depend on them.
+        projection = normalization @ eig_vec
+        signs = np.sign(np.einsum('ij,ij->j', align_signs(projection), projection))
+        self.explained_variance_ = eig_val
+        self.projection_ = projection * signs
+        self.offset_ = moments.mean @ eig_vec * signs
+        return self
+
+    def transform(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        out = np.empty((X.shape[0], self.projection_.shape[1]))
+        for start, batch in self._batches(X):
+            out[start:start + len(batch)] = self._kernel(batch) @ self.projection_
+        out -= self.offset_
+        return out
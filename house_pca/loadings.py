@@ -0,0 +1,68 @@
+"""Which features drive each principal component.
+
+Every statistic is one broadcast operation over the (n_features, k)
+component matrix, so the cost stays linear in the number of features and
+the results export as compact long tables (float32 values, categorical
+feature and component labels) for dashboards.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _labels(n_components):
+    return [f'PC{i + 1}' for i in range(n_components)]
+
+
+def loadings(eig_vec, eig_val):
+    """Correlation of each standardized feature with each component."""
+    return np.asarray(eig_vec) * np.sqrt(np.clip(eig_val, 0.0, None))
+
+
+def squared_cosines(eig_vec, eig_val):
+    """Share of each feature's variance captured by each component (cos²)."""
+    return loadings(eig_vec, eig_val) ** 2
+
+
+def contributions(eig_vec):
+    """Percentage contribution of each feature to each component; columns sum to 100."""
+    eig_vec = np.asarray(eig_vec)
+    squared = eig_vec ** 2
+    return 100.0 * squared / squared.sum(axis=0)
+
+
+def component_table(eig_vec, eig_val, features):
+    """Long table with loading, cos² and contribution per (component, feature)."""
+    eig_vec = np.asarray(eig_vec)
+    n_features, n_components = eig_vec.shape
+    load = loadings(eig_vec, eig_val)
+    return pd.DataFrame({
+        'component': pd.Categorical(np.tile(_labels(n_components), n_features),
+                                    categories=_labels(n_components)),
+        'feature': pd.Categorical(np.repeat(np.asarray(features), n_components)),
+        'loading': load.ravel().astype(np.float32),
+        'cos2': (load ** 2).ravel().astype(np.float32),
+        'contribution': contributions(eig_vec).ravel().astype(np.float32),
+    })
+
+
+def top_contributors(eig_vec, eig_val, features, k=5):
+    """The ``k`` features contributing most to each component, best first."""
+    eig_vec = np.asarray(eig_vec)
+    features = np.asarray(features)
+    n_features, n_components = eig_vec.shape
+    k = min(k, n_features)
+    contrib = contributions(eig_vec)
+    # argpartition selects the top k per column in O(n_features); only those are sorted.
+    top = np.argpartition(-contrib, k - 1, axis=0)[:k]
+    order = np.argsort(-np.take_along_axis(contrib, top, axis=0), axis=0)
+    top = np.take_along_axis(top, order, axis=0)
+    columns = np.arange(n_components)
+    return pd.DataFrame({
+        'component': pd.Categorical(np.tile(_labels(n_components), k),
+                                    categories=_labels(n_components)),
+        'rank': np.repeat(np.arange(1, k + 1), n_components).astype(np.int16),
+        'feature': pd.Categorical(features[top].ravel()),
+        'loading': loadings(eig_vec, eig_val)[top, columns].ravel().astype(np.float32),
+        'contribution': contrib[top, columns].ravel().astype(np.float32),
+    }).sort_values(['component', 'rank'], ignore_index=True)
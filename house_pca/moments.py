@@ -0,0 +1,70 @@
+"""Additive sufficient statistics (count, sum, cross-product) for PCA."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class Moments:
+    """Count, column sums and cross-product matrix of a block of rows.
+
+    Moments of disjoint blocks add up to the moments of their union, so
+    covariance matrices can be assembled (or taken apart) without touching
+    the rows again.
+    """
+
+    count: float
+    total: np.ndarray
+    cross: np.ndarray
+
+    @classmethod
+    def zeros(cls, n_features):
+        return cls(0.0, np.zeros(n_features), np.zeros((n_features, n_features)))
+
+    @classmethod
+    def from_array(cls, X):
+        X = np.asarray(X, dtype=np.float64)
+        return cls(float(X.shape[0]), X.sum(axis=0), X.T @ X)
+
+    def save(self, path):
+        """Write to an ``.npz`` file, e.g. for shipping from a worker to a coordinator."""
+        np.savez(path, count=self.count, total=self.total, cross=self.cross)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as stored:
+            return cls(float(stored['count']), stored['total'], stored['cross'])
+
+    def __add__(self, other):
+        return Moments(self.count + other.count, self.total + other.total,
+                       self.cross + other.cross)
+
+    def __sub__(self, other):
+        return Moments(self.count - other.count, self.total - other.total,
+                       self.cross - other.cross)
+
+    @property
+    def n_features(self):
+        return self.total.shape[0]
+
+    @property
+    def mean(self):
+        return self.total / self.count
+
+    def covariance(self, ddof=1):
+        mean = self.mean
+        centered = self.cross - self.count * np.outer(mean, mean)
+        return centered / (self.count - ddof)
+
+    def std(self, ddof=0):
+        """Column standard deviations; zero-variance columns get 1, as in StandardScaler."""
+        var = np.clip(np.diag(self.covariance(ddof=ddof)), 0.0, None)
+        std = np.sqrt(var)
+        std[std == 0.0] = 1.0
+        return std
+
+    def standardized_covariance(self):
+        """Covariance of the StandardScaler output, i.e. ``np.cov(df_num_std.T)``."""
+        scale = self.std(ddof=0)
+        return self.covariance(ddof=1) / np.outer(scale, scale)
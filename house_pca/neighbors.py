@@ -0,0 +1,105 @@
+"""Comparable-property search in principal-component space.
+
+``ComparableIndex`` is an exact k-d tree over the projected scores (five
+dimensions suit a k-d tree well).  Newly projected listings go to a small
+append buffer that is searched by brute force and merged into the tree once
+it exceeds ``rebuild_fraction`` of the indexed rows, so inserts are cheap and
+queries stay exact.
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+def _merge_topk(distances, ids, k):
+    """Row-wise k smallest of concatenated candidate sets."""
+    k = min(k, distances.shape[1])
+    part = np.argpartition(distances, k - 1, axis=1)[:, :k]
+    part_d = np.take_along_axis(distances, part, axis=1)
+    order = np.argsort(part_d, axis=1)
+    best = np.take_along_axis(part, order, axis=1)
+    return np.take_along_axis(distances, best, axis=1), np.take_along_axis(ids, best, axis=1)
+
+
+def brute_force_knn(points, queries, k, block=256):
+    """Exact k-NN by blocked squared-distance GEMMs; the reference for benchmarks."""
+    points = np.asarray(points, dtype=np.float64)
+    queries = np.atleast_2d(np.asarray(queries, dtype=np.float64))
+    norms = np.einsum('ij,ij->i', points, points)
+    k = min(k, len(points))
+    # Keep each block's distance matrix near 2**25 entries (256 MiB).
+    block = max(1, min(block, 2 ** 25 // max(len(points), 1)))
+    out_d = np.empty((len(queries), k))
+    out_i = np.empty((len(queries), k), dtype=np.int64)
+    for start in range(0, len(queries), block):
+        q = queries[start:start + block]
+        d2 = norms - 2.0 * q @ points.T + np.einsum('ij,ij->i', q, q)[:, None]
+        ids = np.broadcast_to(np.arange(len(points)), d2.shape)
+        d2, idx = _merge_topk(d2, ids, k)
+        out_d[start:start + block] = np.sqrt(np.maximum(d2, 0.0))
+        out_i[start:start + block] = idx
+    return out_d, out_i
+
+
+class ComparableIndex:
+    """Exact k-NN over PC scores with incremental insertion.
+
+    Parameters
+    ----------
+    scores : array-like of shape (n_listings, n_components)
+        Projected listings, e.g. ``df_pca.to_numpy()``.
+    ids : array-like, optional
+        Listing identifiers returned by ``query``; defaults to row positions.
+    rebuild_fraction : float
+        Rebuild the tree when buffered inserts exceed this share of indexed rows.
+    leafsize : int
+        k-d tree leaf size.
+    """
+
+    def __init__(self, scores, ids=None, rebuild_fraction=0.05, leafsize=32):
+        scores = np.asarray(scores, dtype=np.float64)
+        self.rebuild_fraction = rebuild_fraction
+        self.leafsize = leafsize
+        self._scores = scores
+        self._ids = np.arange(len(scores)) if ids is None else np.asarray(ids)
+        self._pending_scores = []
+        self._pending_ids = []
+        self._n_pending = 0
+        self._tree = cKDTree(scores, leafsize=leafsize)
+
+    def __len__(self):
+        return len(self._scores) + self._n_pending
+
+    def add(self, scores, ids):
+        """Insert newly projected listings."""
+        scores = np.atleast_2d(np.asarray(scores, dtype=np.float64))
+        self._pending_scores.append(scores)
+        self._pending_ids.append(np.asarray(ids))
+        self._n_pending += len(scores)
+        if self._n_pending > self.rebuild_fraction * len(self._scores):
+            self.rebuild()
+        return self
+
+    def rebuild(self):
+        """Merge buffered inserts into the tree."""
+        if self._n_pending:
+            self._scores = np.vstack([self._scores, *self._pending_scores])
+            self._ids = np.concatenate([self._ids, *self._pending_ids])
+            self._pending_scores, self._pending_ids, self._n_pending = [], [], 0
+            self._tree = cKDTree(self._scores, leafsize=self.leafsize)
+        return self
+
+    def query(self, queries, k=20, workers=-1):
+        """Distances and ids of the ``k`` nearest listings for each query row."""
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float64))
+        k_tree = min(k, len(self._scores))
+        distances, positions = self._tree.query(queries, k=k_tree, workers=workers)
+        distances = distances.reshape(len(queries), k_tree)
+        ids = self._ids[positions.reshape(len(queries), k_tree)]
+        if self._n_pending:
+            pending = np.vstack(self._pending_scores)
+            pending_ids = np.concatenate(self._pending_ids)
+            extra_d, extra_pos = brute_force_knn(pending, queries, k)
+            distances, ids = _merge_topk(np.hstack([distances, extra_d]),
+                                         np.hstack([ids, pending_ids[extra_pos]]), k)
+        return distances, ids
@@ -0,0 +1,219 @@
+"""The PCA.py analysis as a staged, importable pipeline.
+
+Stages run in order ``load -> clean -> engineer -> scale -> decompose ->
+project``.  Each stage's output is kept on the pipeline and reused until an
+upstream input changes, its wall time is recorded in ``timings``, and the
+decomposition can additionally be shared across pipelines and sessions
+through a content-keyed ``DecompositionCache``.  Nothing runs at import time.
+"""
+
+import datetime as dt
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from .decomposition import covariance_eig
+from .encoding import ORDINAL_LEVELS, encode_ordinal
+from .projection import AffineProjection
+
+STAGES = ('load', 'clean', 'engineer', 'scale', 'decompose', 'project')
+
+# Missing values that mean "feature absent", as filled in PCA.py.
+CATEGORY_FILLS = {
+    'Alley': 'No alley access',
+    'MasVnrType': 'None',
+    'BsmtQual': 'No Basement', 'BsmtCond': 'No Basement', 'BsmtExposure': 'No Basement',
+    'BsmtFinType1': 'No Basement', 'BsmtFinType2': 'No Basement',
+    'Electrical': 'SBrkr',
+    'FireplaceQu': 'No Fireplace',
+    'GarageType': 'No Garage', 'GarageFinish': 'No Garage', 'GarageQual': 'No Garage',
+    'GarageCond': 'No Garage',
+    'PoolQC': 'No Pool',
+    'Fence': 'No Fence',
+    'MiscFeature': 'None',
+}
+ZERO_FILLS = ('MasVnrArea', 'GarageYrBlt')
+MEDIAN_FILLS = ('LotFrontage',)
+# Numeric codes that are really categories.
+CATEGORICAL_CODES = ('MSSubClass', 'OverallQual', 'OverallCond')
+TARGET = 'SalePrice'
+
+
+def load(path, **read_csv_kwargs):
+    """Read the listing CSV with ``Id`` as index."""
+    return pd.read_csv(path, index_col=0, **read_csv_kwargs)
+
+
+def clean(raw_data, medians=None):
+    """Fill missing values the way PCA.py does; returns a new frame.
+
+    ``medians`` maps median-filled columns to fill values learned elsewhere
+    (e.g. by a ``SketchImputer`` over all chunks); columns missing from it
+    are left unfilled.  By default the medians of ``raw_data`` are used.
+    """
+    fills = {column: value for column, value in CATEGORY_FILLS.items()
+             if column in raw_data.columns}
+    fills.update({column: 0 for column in ZERO_FILLS if column in raw_data.columns})
+    if medians is None:
+        medians = {column: raw_data[column].median() for column in MEDIAN_FILLS
+                   if column in raw_data.columns}
+    fills.update(medians)
+    # Categorical columns (e.g. read with ``Schema.dtypes()``) need the fill label as a level.
+    levels = {column: raw_data[column].cat.add_categories([value])
+              for column, value in fills.items()
+              if isinstance(raw_data[column].dtype, pd.CategoricalDtype)
+              and value not in raw_data[column].cat.categories}
+    return raw_data.assign(**levels).fillna(fills)
+
+
+def engineer(data, current_year=None, ordinal_levels=ORDINAL_LEVELS):
+    """Cast coded categories to object, encode quality scales, add ages.
+
+    Columns in ``ordinal_levels`` become ordinal codes and so join
+    ``df_num``; pass ``None`` to leave them as text as PCA.py did.
+    """
+    year = int(dt.datetime.now().year) if current_year is None else current_year
+    data = data.astype({column: 'object' for column in CATEGORICAL_CODES
+                        if column in data.columns})
+    if ordinal_levels:
+        data = encode_ordinal(data, ordinal_levels)
+    # Frames read with ``usecols`` (e.g. for sparse scoring) may lack the sources.
+    ages = {name: year - data[source]
+            for name, source in (('Buiding_age', 'YearBuilt'), ('Remodel_age', 'YearRemodAdd'))
+            if source in data.columns}
+    return data.assign(**ages)
+
+
+def numeric_features(data):
+    """``df_num``: numeric predictors without the target."""
+    return data.select_dtypes(include=[np.number]).drop(columns=TARGET, errors='ignore')
+
+
+class HousePricePipeline:
+    """Staged version of the PCA.py analysis.
+
+    Parameters
+    ----------
+    path : str
+        Listing CSV.
+    n_components : int
+        Components kept by ``project``.
+    current_year : int, optional
+        Reference year for the age features; defaults to today.
+    ordinal_levels : dict, optional
+        Quality-scale level map for ``engineer``; None keeps those columns
+        out of the numeric features.
+    schema : Schema, optional
+        When given, ``load`` reads with ``schema.dtypes()`` and ``clean``
+        drops rows failing validation and keeps them in ``quarantine``.
+    cache : DecompositionCache, optional
+        Shares eigenpairs across pipelines fitted on identical data.
+    """
+
+    def __init__(self, path='houseprice.csv', n_components=5, current_year=None,
+                 ordinal_levels=ORDINAL_LEVELS, schema=None, cache=None):
+        self.path = path
+        self.n_components = n_components
+        self.current_year = current_year
+        self.ordinal_levels = ordinal_levels
+        self.schema = schema
+        self.cache = cache
+        self.results = {}
+        self.timings = {}
+        self.quarantine = None
+
+    def invalidate(self, stage='load'):
+        """Forget ``stage`` and everything downstream of it."""
+        for name in STAGES[STAGES.index(stage):]:
+            self.results.pop(name, None)
+            self.timings.pop(name, None)
+        return self
+
+    def set_params(self, **params):
+        """Change parameters, invalidating only the stages they affect."""
+        first = {'path': 'load', 'schema': 'load', 'current_year': 'engineer',
+                 'ordinal_levels': 'engineer', 'cache': 'decompose',
+                 'n_components': 'project'}
+        stages = []
+        for name, value in params.items():
+            if name not in first:
+                raise ValueError(f'unknown parameter {name!r}')
+            setattr(self, name, value)
+            stages.append(STAGES.index(first[name]))
+        if stages:
+            self.invalidate(STAGES[min(stages)])
+        return self
+
+    def _stage(self, name, func):
+        if name not in self.results:
+            start = time.perf_counter()
+            self.results[name] = func()
+            self.timings[name] = time.perf_counter() - start
+        return self.results[name]
+
+    def load(self):
+        # With a schema, category columns are parsed straight to categoricals,
+        # which keeps validation a small share of ingestion.
+        dtype = None if self.schema is None else self.schema.dtypes()
+        return self._stage('load', lambda: load(self.path, dtype=dtype))
+
+    def clean(self):
+        def run():
+            data = self.load()
+            if self.schema is not None:
+                report = self.schema.validate(data)
+                self.quarantine = report.quarantine
+                data = report.valid
+            return clean(data)
+        return self._stage('clean', run)
+
+    def engineer(self):
+        return self._stage('engineer', lambda: engineer(self.clean(), self.current_year,
+                                                        self.ordinal_levels))
+
+    def scale(self):
+        """Fitted ``StandardScaler`` and ``df_num_std``."""
+        def run():
+            df_num = numeric_features(self.engineer())
+            scaler = StandardScaler().fit(df_num)
+            return scaler, scaler.transform(df_num)
+        return self._stage('scale', run)
+
+    def decompose(self):
+        """All eigenpairs of ``cov_mat``, largest first."""
+        def run():
+            _, df_num_std = self.scale()
+            return covariance_eig(np.cov(df_num_std.T), cache=self.cache)
+        return self._stage('decompose', run)
+
+    def project(self):
+        """``df_pca``: scores on the first ``n_components`` components."""
+        def run():
+            _, df_num_std = self.scale()
+            _, eig_vec = self.decompose()
+            columns = [f'PC{i + 1}' for i in range(self.n_components)]
+            return pd.DataFrame(df_num_std @ eig_vec[:, :self.n_components],
+                                index=self.engineer().index, columns=columns)
+        return self._stage('project', run)
+
+    def run(self, until='project'):
+        """Run (or reuse) every stage up to ``until`` and return its output."""
+        return getattr(self, until)()
+
+    @property
+    def feature_names(self):
+        return list(numeric_features(self.engineer()).columns)
+
+    @property
+    def target(self):
+        return self.engineer()[TARGET]
+
+    def projection(self, whiten=False):
+        """``AffineProjection`` from raw numeric features to the kept components."""
+        scaler, _ = self.scale()
+        eig_val, eig_vec = self.decompose()
+        k = self.n_components
+        return AffineProjection(scaler.mean_, scaler.scale_, eig_vec[:, :k], eig_val[:k],
+                                whiten=whiten)
@@ -0,0 +1,163 @@
+"""Single-pass column profiling for in-memory frames and streamed chunks.
+
+Replaces the ``isnull().sum()`` missing-data table and ``raw_data.info()``
+with one report holding null counts, min/max, mean/std, quantiles and
+cardinality per column.  Columns are split into groups that are profiled
+concurrently; numeric groups are reduced as one 2-D block, so each group
+costs a single vectorized pass over its columns.  Every statistic is
+mergeable (Chan's update for mean/variance, t-digest quantiles, KMV distinct
+counts), so chunks of a file larger than memory are folded in one at a time.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .io import read_chunks
+from .sketches import CardinalitySketch, QuantileSketch
+
+
+class _GroupStats:
+    """Vectorized accumulators for one group of columns."""
+
+    def __init__(self, columns, compression, cardinality_k):
+        n = len(columns)
+        self.columns = list(columns)
+        self.rows = 0
+        self.nulls = np.zeros(n, dtype=np.int64)
+        self.count = np.zeros(n)
+        self.mean = np.zeros(n)
+        self.m2 = np.zeros(n)
+        self.min = np.full(n, np.inf)
+        self.max = np.full(n, -np.inf)
+        self.non_numeric = np.zeros(n, dtype=bool)
+        self.quantiles = [QuantileSketch(compression) for _ in columns]
+        self.distinct = [CardinalitySketch(cardinality_k) for _ in columns]
+
+    def update(self, frame):
+        block = frame[self.columns]
+        self.rows += len(block)
+        self.nulls += block.isna().to_numpy().sum(axis=0)
+        numeric = np.array([pd.api.types.is_numeric_dtype(t) for t in block.dtypes])
+        for i, column in enumerate(self.columns):
+            self.distinct[i].update(block[column])
+        self.non_numeric |= ~numeric & (block.notna().to_numpy().sum(axis=0) > 0)
+        if not numeric.any():
+            return
+        idx = np.flatnonzero(numeric)
+        values = block.iloc[:, idx].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0).astype(np.float64)
+        seen = count > 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(seen, np.nansum(values, axis=0) / count, 0.0)
+            m2 = np.nansum((values - mean) ** 2, axis=0)
+        self._combine(idx[seen], count[seen], mean[seen], m2[seen],
+                      np.nanmin(values[:, seen], axis=0), np.nanmax(values[:, seen], axis=0))
+        for j, i in enumerate(idx):
+            self.quantiles[i].update(values[:, j])
+
+    def merge(self, other):
+        self.rows += other.rows
+        self.nulls += other.nulls
+        self.non_numeric |= other.non_numeric
+        idx = np.arange(len(self.columns))
+        self._combine(idx, other.count, other.mean, other.m2, other.min, other.max)
+        for mine, theirs in zip(self.quantiles, other.quantiles):
+            mine.merge(theirs)
+        for mine, theirs in zip(self.distinct, other.distinct):
+            mine.merge(theirs)
+
+    def _combine(self, idx, count, mean, m2, minimum, maximum):
+        total = self.count[idx] + count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean - self.mean[idx]
+            share = np.where(total > 0, count / total, 0.0)
+            self.mean[idx] += delta * share
+            self.m2[idx] += m2 + delta ** 2 * self.count[idx] * share
+        self.count[idx] = total
+        self.min[idx] = np.minimum(self.min[idx], minimum)
+        self.max[idx] = np.maximum(self.max[idx], maximum)
+
+
+class FrameProfiler:
+    """Accumulates a per-column profile over one frame or many chunks.
+
+    Parameters
+    ----------
+    quantiles : sequence of float
+        Quantiles reported for numeric columns.
+    group_size : int
+        Columns per parallel work item.
+    n_jobs : int, optional
+        Worker threads; defaults to the executor's choice.
+    compression, cardinality_k : int
+        Accuracy/memory settings of the quantile and distinct-count sketches.
+    """
+
+    def __init__(self, quantiles=(0.25, 0.5, 0.75), group_size=8, n_jobs=None,
+                 compression=200, cardinality_k=4096):
+        self.quantiles = tuple(quantiles)
+        self.group_size = group_size
+        self.n_jobs = n_jobs
+        self.compression = compression
+        self.cardinality_k = cardinality_k
+        self.groups = None
+        self.dtypes = None
+
+    def update(self, frame):
+        if self.groups is None:
+            columns = list(frame.columns)
+            self.dtypes = frame.dtypes.astype(str)
+            self.groups = [_GroupStats(columns[i:i + self.group_size],
+                                       self.compression, self.cardinality_k)
+                           for i in range(0, len(columns), self.group_size)]
+        else:
+            # An all-NaN chunk of a text column parses as float64; keep the text dtype.
+            textual = frame.notna().any() & ~frame.dtypes.map(pd.api.types.is_numeric_dtype)
+            self.dtypes[textual] = frame.dtypes[textual].astype(str)
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as pool:
+            list(pool.map(lambda group: group.update(frame), self.groups))
+        return self
+
+    def merge(self, other):
+        for mine, theirs in zip(self.groups, other.groups):
+            mine.merge(theirs)
+        return self
+
+    def report(self):
+        """One row per column, sorted like the missing-data table (most nulls first)."""
+        rows = []
+        for group in self.groups:
+            for i, column in enumerate(group.columns):
+                numeric = group.count[i] > 0 and not group.non_numeric[i]
+                row = {'Total': group.nulls[i],
+                       'Percent': group.nulls[i] * 100 / group.rows if group.rows else np.nan,
+                       'dtype': self.dtypes[column],
+                       'cardinality': group.distinct[i].estimate(),
+                       'min': group.min[i] if numeric else np.nan,
+                       'max': group.max[i] if numeric else np.nan,
+                       'mean': group.mean[i] if numeric else np.nan,
+                       'std': (np.sqrt(group.m2[i] / (group.count[i] - 1))
+                               if numeric and group.count[i] > 1 else np.nan)}
+                estimates = group.quantiles[i].quantile(self.quantiles) if numeric else \
+                    [np.nan] * len(self.quantiles)
+                for q, value in zip(self.quantiles, np.atleast_1d(estimates)):
+                    row[f'q{q:g}'] = value
+                rows.append(pd.Series(row, name=column))
+        report = pd.DataFrame(rows)
+        return report.sort_values('Total', ascending=False, kind='stable')
+
+
+def profile_frame(frame, **kwargs):
+    """Profile report of an in-memory DataFrame."""
+    return FrameProfiler(**kwargs).update(frame).report()
+
+
+def profile_csv(path, chunksize=100_000, read_csv_kwargs=None, **kwargs):
+    """Profile report of a CSV file read in chunks of ``chunksize`` rows."""
+    profiler = FrameProfiler(**kwargs)
+    for chunk in read_chunks(path, chunksize, **(read_csv_kwargs or {})):
+        profiler.update(chunk)
+    return profiler.report()
@@ -0,0 +1,65 @@
+"""Scaler and components folded into one affine map, in both directions.
+
+Projecting raw rows means ``((x - mean) / scale) @ V``, optionally divided by
+``sqrt(eig_val)`` for whitening; going back to square feet, years and
+dollars means undoing each step.  Both chains are linear, so they collapse
+into ``x @ W + b`` and ``z @ W_inv + mean`` with W, b and W_inv precomputed
+at fit time: one GEMM plus a bias add per batch, with no standardized or
+unwhitened intermediate arrays.
+"""
+
+import numpy as np
+
+
+class AffineProjection:
+    """Fitted forward/inverse PCA map for raw (unscaled) feature rows.
+
+    Parameters
+    ----------
+    mean, scale : ndarray of shape (n_features,)
+        StandardScaler statistics.
+    eig_vec : ndarray of shape (n_features, k)
+        Retained components.
+    eig_val : ndarray of shape (k,), optional
+        Component variances; required when ``whiten=True``.
+    whiten : bool
+        Scale scores to unit variance.
+    """
+
+    def __init__(self, mean, scale, eig_vec, eig_val=None, whiten=False):
+        mean = np.asarray(mean, dtype=np.float64)
+        scale = np.asarray(scale, dtype=np.float64)
+        eig_vec = np.asarray(eig_vec, dtype=np.float64)
+        if whiten:
+            if eig_val is None:
+                raise ValueError('eig_val is required for whitening')
+            eig_val = np.asarray(eig_val, dtype=np.float64)
+            # Null directions (collinear columns) would divide by zero.
+            root = np.sqrt(np.maximum(eig_val, np.finfo(np.float64).eps * eig_val.max()))
+        else:
+            root = np.ones(eig_vec.shape[1])
+        self.whiten = whiten
+        self.mean = mean
+        self.weight = eig_vec / scale[:, None] / root
+        self.bias = -mean @ self.weight
+        self.inverse_weight = (eig_vec * root).T * scale
+
+    @classmethod
+    def from_sklearn(cls, scaler, pca, whiten=False):
+        """Build from a fitted ``StandardScaler`` and ``PCA``."""
+        scale = scaler.scale_ if scaler.scale_ is not None else np.ones_like(scaler.mean_)
+        # sklearn's PCA centres the scaled data again; fold that shift into the mean.
+        mean = scaler.mean_ + pca.mean_ * scale
+        return cls(mean, scale, pca.components_.T, pca.explained_variance_, whiten)
+
+    def transform(self, X, out=None):
+        """Scores of raw rows: ``X @ W + b``."""
+        out = np.matmul(np.asarray(X, dtype=np.float64), self.weight, out=out)
+        out += self.bias
+        return out
+
+    def inverse_transform(self, Z, out=None):
+        """Rows in original units reconstructed from (whitened) scores."""
+        out = np.matmul(np.asarray(Z, dtype=np.float64), self.inverse_weight, out=out)
+        out += self.mean
+        return out
@@ -0,0 +1,141 @@
+"""Compact storage of projected PC scores.
+
+Each component is mapped affinely onto the full range of a signed integer
+type, ``x ~ offset + scale * code``, with its own ``scale`` and ``offset``
+chosen from the component's min and max.  The rounding error is at most
+``scale / 2`` per value, i.e. 1/254 (int8) or 1/65534 (int16) of the
+component's range, while the codes take an eighth or a quarter of the
+float64 ``df_pca``.
+
+``QuantizedScores.save`` writes the codes as a plain ``.npy`` file next to a
+small metadata file, so ``load`` can memory-map them and ``dequantize``
+decodes only the rows and components asked for, in one broadcasted
+multiply-add.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+CODE_DTYPES = {'int8': np.int8, 'int16': np.int16}
+
+
+def _encode_index(index):
+    """Evenly spaced integer labels (``Id`` 1..n) are stored as a range, not per row."""
+    values = index.to_numpy()
+    if pd.api.types.is_integer_dtype(values.dtype) and len(values) > 1:
+        step = values[1] - values[0]
+        if step != 0 and np.all(np.diff(values) == step):
+            return {'index_range': np.array([values[0], values[0] + step * len(values), step])}
+    return {'index': values.astype(str) if values.dtype == object else values}
+
+
+def _decode_index(meta):
+    if 'index_range' in meta:
+        return pd.RangeIndex(*meta['index_range'].tolist())
+    return pd.Index(meta['index'])
+
+
+class QuantizedScores:
+    """Per-component scaled integer codes of a score matrix.
+
+    Parameters
+    ----------
+    codes : ndarray of shape (n_rows, n_components)
+        int8 or int16 codes, possibly a read-only memory map.
+    scale, offset : ndarray of shape (n_components,)
+        Decoding is ``offset + scale * codes``.
+    index : array-like, optional
+        Row labels, e.g. listing Ids; defaults to row positions.
+    columns : list of str, optional
+        Component names; defaults to ``PC1 ... PCk``.
+    """
+
+    def __init__(self, codes, scale, offset, index=None, columns=None):
+        self.codes = codes
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.offset = np.asarray(offset, dtype=np.float64)
+        self.index = pd.RangeIndex(len(codes)) if index is None else pd.Index(index)
+        self.columns = ([f'PC{i + 1}' for i in range(codes.shape[1])] if columns is None
+                        else list(columns))
+
+    @classmethod
+    def from_scores(cls, scores, dtype='int8'):
+        """Quantize a score matrix or a ``df_pca``-style DataFrame."""
+        index = columns = None
+        if isinstance(scores, pd.DataFrame):
+            index, columns = scores.index, scores.columns
+        values = np.asarray(scores, dtype=np.float64)
+        code_dtype = CODE_DTYPES[dtype]
+        limit = np.iinfo(code_dtype).max
+        low, high = values.min(axis=0), values.max(axis=0)
+        offset = (high + low) / 2.0
+        scale = (high - low) / (2.0 * limit)
+        scale[scale == 0] = 1.0
+        codes = np.rint((values - offset) / scale)
+        codes = np.clip(codes, -limit, limit, out=codes).astype(code_dtype)
+        return cls(codes, scale, offset, index, columns)
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def nbytes(self):
+        return self.codes.nbytes
+
+    @property
+    def max_error(self):
+        """Worst-case absolute rounding error per component."""
+        return self.scale / 2.0
+
+    def dequantize(self, rows=None, columns=None, dtype=np.float64):
+        """Decoded scores for the selected rows (slice, mask or positions) and components."""
+        cols = slice(None) if columns is None else np.asarray(
+            [self.columns.index(c) if isinstance(c, str) else c for c in columns])
+        codes = self.codes if rows is None else self.codes[rows]
+        codes = codes[:, cols]
+        out = np.multiply(codes, self.scale[cols].astype(dtype), dtype=dtype)
+        out += self.offset[cols].astype(dtype)
+        return out
+
+    def to_frame(self, rows=None, dtype=np.float64):
+        """Decoded scores as a DataFrame shaped like ``df_pca``."""
+        index = self.index if rows is None else self.index[rows]
+        return pd.DataFrame(self.dequantize(rows, dtype=dtype), index=index,
+                            columns=self.columns)
+
+    def error_report(self, scores):
+        """Rounding error against the original scores, per component.
+
+        ``relative_rmse`` is the RMSE divided by the component's standard
+        deviation, so it reads as the share of the component's spread lost
+        (0 for a constant component, which decodes exactly).
+        """
+        values = np.asarray(scores, dtype=np.float64)
+        error = self.dequantize() - values
+        rmse = np.sqrt(np.mean(error ** 2, axis=0))
+        spread = values.std(axis=0)
+        return pd.DataFrame({'max_abs_error': np.abs(error).max(axis=0),
+                             'bound': self.max_error,
+                             'rmse': rmse,
+                             'relative_rmse': np.divide(rmse, spread, out=np.zeros_like(rmse),
+                                                        where=spread > 0)},
+                            index=self.columns)
+
+    def save(self, directory):
+        """Write ``codes.npy`` and ``meta.npz`` into ``directory``."""
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, 'codes.npy'), np.ascontiguousarray(self.codes))
+        np.savez(os.path.join(directory, 'meta.npz'), scale=self.scale, offset=self.offset,
+                 index_name=np.array(self.index.name or ''), columns=np.array(self.columns),
+                 **_encode_index(self.index))
+
+    @classmethod
+    def load(cls, directory, mmap_mode='r'):
+        """Read stored scores; the codes stay on disk unless ``mmap_mode`` is None."""
+        codes = np.load(os.path.join(directory, 'codes.npy'), mmap_mode=mmap_mode)
+        with np.load(os.path.join(directory, 'meta.npz')) as meta:
+            index = _decode_index(meta)
+            index.name = str(meta['index_name']) or None
+            return cls(codes, meta['scale'], meta['offset'], index, meta['columns'].tolist())
@@ -0,0 +1,146 @@
+"""PCA over sliding sale-date windows from per-month sufficient statistics.
+
+Rows are bucketed by sale month (``YrSold``, ``MoSold``) once, and each month
+keeps its additive ``Moments``.  Their running sums turn the moments of any
+window of months into one subtraction of two prefix entries, so the
+covariance of, say, the last 24 months is O(features^2) to assemble and
+sliding the window by a month costs a single small eigendecomposition.  No
+rows are rescanned.  New months (or late rows of an existing month) only
+update that month's block and the prefix entries after it.
+
+Rows are shifted by a fixed reference (the mean at fit time) before they are
+accumulated, so differences of large prefix sums do not lose precision.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .distributed import fit_from_moments
+from .moments import Moments
+
+
+class RollingWindowPCA:
+    """Per-month moments with prefix sums, fitted for any window of months.
+
+    Parameters
+    ----------
+    n_components : int
+        Components kept per window.
+    """
+
+    def __init__(self, n_components=5):
+        self.n_components = n_components
+
+    @staticmethod
+    def _period_codes(year, month):
+        return np.asarray(year, dtype=np.int64) * 12 + np.asarray(month, dtype=np.int64) - 1
+
+    def fit(self, X, year, month):
+        """Bucket rows by sale month, e.g. ``fit(df_num, data['YrSold'], data['MoSold'])``."""
+        self.columns_ = (list(X.columns) if isinstance(X, pd.DataFrame)
+                         else list(range(X.shape[1])))
+        X = np.asarray(X, dtype=np.float64)
+        self.reference_ = X.mean(axis=0)
+        codes = self._period_codes(year, month)
+        self.first_period_ = int(codes.min())
+        n_periods = int(codes.max()) - self.first_period_ + 1
+        self._count = np.zeros(n_periods)
+        self._total = np.zeros((n_periods, X.shape[1]))
+        self._cross = np.zeros((n_periods, X.shape[1], X.shape[1]))
+        self._prefix_count = self._prefix_total = self._prefix_cross = None
+        self._accumulate(X, codes)
+        return self
+
+    def partial_fit(self, X, year, month):
+        """Add rows for existing or later months without touching earlier blocks."""
+        codes = self._period_codes(year, month)
+        if codes.min() < self.first_period_:
+            raise ValueError('rows precede the first fitted month')
+        extra = int(codes.max()) - self.first_period_ + 1 - len(self._count)
+        if extra > 0:
+            n_features = self._total.shape[1]
+            self._count = np.concatenate([self._count, np.zeros(extra)])
+            self._total = np.concatenate([self._total, np.zeros((extra, n_features))])
+            self._cross = np.concatenate([self._cross,
+                                          np.zeros((extra, n_features, n_features))])
+        self._accumulate(np.asarray(X, dtype=np.float64), codes)
+        return self
+
+    def _accumulate(self, X, codes):
+        X = X - self.reference_
+        slots = codes - self.first_period_
+        order = np.argsort(slots, kind='stable')
+        ordered, slots = X[order], slots[order]
+        present, starts = np.unique(slots, return_index=True)
+        stops = np.append(starts[1:], len(slots))
+        self._count[present] += stops - starts
+        self._total[present] += np.add.reduceat(ordered, starts, axis=0)
+        for slot, start, stop in zip(present, starts, stops):
+            block = ordered[start:stop]
+            self._cross[slot] += block.T @ block
+        self._update_prefix(int(present.min()))
+
+    def _update_prefix(self, changed):
+        """Recompute prefix entries after month slot ``changed``; entry i sums months [0, i)."""
+        # Months appended by ``partial_fit`` (possibly empty, when rows skip a
+        # month) have no prefix entry yet, so restart at the first of them too.
+        start = 0 if self._prefix_count is None else min(changed, len(self._prefix_count) - 1)
+
+        def prefix(old, blocks):
+            head = np.zeros((1,) + blocks.shape[1:]) if start == 0 else old[:start + 1]
+            return np.concatenate([head, head[-1] + np.cumsum(blocks[start:], axis=0)])
+
+        self._prefix_count = prefix(self._prefix_count, self._count)
+        self._prefix_total = prefix(self._prefix_total, self._total)
+        self._prefix_cross = prefix(self._prefix_cross, self._cross)
+        if len(self._prefix_count) != len(self._count) + 1:
+            raise RuntimeError('prefix sums are out of step with the month blocks')
+
+    @property
+    def periods(self):
+        """Sale months covered, as a monthly ``PeriodIndex``."""
+        codes = self.first_period_ + np.arange(len(self._count))
+        return pd.PeriodIndex.from_fields(year=codes // 12, month=codes % 12 + 1, freq='M')
+
+    @property
+    def month_counts(self):
+        return pd.Series(self._count.astype(np.int64), index=self.periods, name='rows')
+
+    def _slot(self, period):
+        period = pd.Period(period, freq='M')
+        return period.year * 12 + period.month - 1 - self.first_period_
+
+    def window_moments(self, end, months=24):
+        """Moments of the ``months`` months ending with ``end`` (inclusive).
+
+        The moments are of the rows shifted by ``reference_``.
+        """
+        stop = self._slot(end) + 1
+        start = max(stop - months, 0)
+        if not 0 < stop <= len(self._count):
+            raise ValueError(f'{end} is outside the fitted months')
+        return Moments(self._prefix_count[stop] - self._prefix_count[start],
+                       self._prefix_total[stop] - self._prefix_total[start],
+                       self._prefix_cross[stop] - self._prefix_cross[start])
+
+    def window(self, end, months=24):
+        """Scaler statistics and eigenpairs of one window, as ``DistributedPCAResult``."""
+        moments = self.window_moments(end, months)
+        if moments.count < 2:
+            raise ValueError(f'the window ending {end} holds fewer than two rows')
+        result = fit_from_moments(moments, self.columns_, self.n_components)
+        result.mean = result.mean + self.reference_
+        return result
+
+    def rolling(self, months=24, min_rows=2):
+        """Fit every full window; yields ``(end_month, result)`` pairs."""
+        for end in self.periods[months - 1:]:
+            moments = self.window_moments(end, months)
+            if moments.count >= min_rows:
+                yield end, self.window(end, months)
+
+    def explained_variance(self, months=24, min_rows=2):
+        """Leading eigenvalues of every full window, one row per end month."""
+        rows = {end: result.eig_val for end, result in self.rolling(months, min_rows)}
+        columns = [f'PC{i + 1}' for i in range(self.n_components)]
+        return pd.DataFrame.from_dict(rows, orient='index', columns=columns)
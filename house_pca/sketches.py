@@ -0,0 +1,205 @@
+"""Mergeable streaming sketches for quantiles, frequent items and distinct counts.
+
+Each sketch (a t-digest for quantiles, Misra-Gries for frequent items and
+KMV for distinct counts) summarises a column seen in arbitrary chunks;
+sketches built on different chunks or machines merge into the sketch of the
+combined data.
+``compression`` / ``capacity`` / ``k`` trade accuracy for memory, and ``to_dict`` /
+``from_dict`` give a plain, JSON-serialisable form for storing them inside
+fitted models.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class QuantileSketch:
+    """Merging t-digest.
+
+    Values are buffered and periodically merged into at most about
+    ``compression`` weighted centroids, kept small near the tails (arcsine
+    scale function) so that extreme quantiles stay accurate.  Rank error is
+    roughly ``1 / compression`` in the middle of the distribution.
+    """
+
+    def __init__(self, compression=100, buffer_size=None):
+        self.compression = compression
+        self.buffer_size = buffer_size or 20 * compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+        self._buffer = []
+        self._buffered = 0
+
+    @property
+    def count(self):
+        self._flush()
+        return float(self.weights.sum())
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self._buffer.append(values)
+        self._buffered += values.size
+        if self._buffered >= self.buffer_size:
+            self._flush()
+        return self
+
+    def merge(self, other):
+        other._flush()
+        self._flush()
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(np.concatenate([self.means, other.means]),
+                       np.concatenate([self.weights, other.weights]))
+        return self
+
+    def quantile(self, q):
+        """Estimated quantile(s) for ``q`` in [0, 1]; NaN when empty."""
+        self._flush()
+        q = np.asarray(q, dtype=np.float64)
+        if self.weights.size == 0:
+            return np.full(q.shape, np.nan)[()]
+        total = self.weights.sum()
+        centers = np.cumsum(self.weights) - self.weights / 2
+        ranks = np.concatenate([[0.0], centers, [total]])
+        points = np.concatenate([[self.min], self.means, [self.max]])
+        return np.interp(q * total, ranks, points)[()]
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        values = np.concatenate(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+        self._compress(np.concatenate([self.means, values]),
+                       np.concatenate([self.weights, np.ones(values.size)]))
+
+    def _compress(self, means, weights):
+        if means.size == 0:
+            self.means, self.weights = means, weights
+            return
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+        cumulative = np.cumsum(weights)
+        q_start = (cumulative - weights) / cumulative[-1]
+        # Arcsine scale: every integer step of k holds one centroid.
+        k = self.compression / np.pi * np.arcsin(2 * q_start - 1)
+        bucket = np.floor(k - k[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        merged_weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged_weights
+        self.weights = merged_weights
+
+    def to_dict(self):
+        self._flush()
+        return {'compression': self.compression, 'min': float(self.min),
+                'max': float(self.max), 'means': self.means.tolist(),
+                'weights': self.weights.tolist()}
+
+    @classmethod
+    def from_dict(cls, state):
+        sketch = cls(state['compression'])
+        sketch.min, sketch.max = state['min'], state['max']
+        sketch.means = np.asarray(state['means'], dtype=np.float64)
+        sketch.weights = np.asarray(state['weights'], dtype=np.float64)
+        return sketch
+
+
+class CardinalitySketch:
+    """K-minimum-values distinct counter.
+
+    Keeps the ``k`` smallest 64-bit hashes of the values seen; the count is
+    exact below ``k`` distinct values and has relative error about
+    ``1 / sqrt(k)`` above it.
+    """
+
+    def __init__(self, k=1024):
+        self.k = k
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def update(self, values):
+        values = pd.Series(values).dropna()
+        # Hash numbers as float64 so 5 and 5.0 from differently typed chunks agree.
+        if pd.api.types.is_numeric_dtype(values.dtype):
+            values = values.astype(np.float64)
+        values = values.to_numpy()
+        if values.size:
+            self._keep(pd.util.hash_array(values))
+        return self
+
+    def merge(self, other):
+        self._keep(other.hashes)
+        return self
+
+    def estimate(self):
+        if self.hashes.size < self.k:
+            return float(self.hashes.size)
+        return (self.k - 1) / (float(self.hashes[-1]) / 2.0 ** 64)
+
+    def _keep(self, hashes):
+        combined = np.unique(np.concatenate([self.hashes, hashes]))
+        self.hashes = combined[:self.k]
+
+    def to_dict(self):
+        return {'k': self.k, 'hashes': [int(h) for h in self.hashes]}
+
+    @classmethod
+    def from_dict(cls, state):
+        sketch = cls(state['k'])
+        sketch.hashes = np.asarray(state['hashes'], dtype=np.uint64)
+        return sketch
+
+
+class FrequentItemsSketch:
+    """Misra-Gries heavy-hitter summary with at most ``capacity`` counters.
+
+    Any value occurring more than ``n / (capacity + 1)`` times is guaranteed
+    to be kept, and stored counts underestimate true counts by at most that
+    amount, so the most frequent value is exact whenever it is a clear mode.
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.float64)
+
+    def update(self, values):
+        counts = pd.Series(values).value_counts(dropna=True).astype(np.float64)
+        return self._combine(counts)
+
+    def merge(self, other):
+        return self._combine(other.counts)
+
+    def most_frequent(self):
+        if self.counts.empty:
+            return np.nan
+        return self.counts.idxmax()
+
+    def _combine(self, counts):
+        if counts.empty:
+            return self
+        combined = counts if self.counts.empty else self.counts.add(counts, fill_value=0.0)
+        if len(combined) > self.capacity:
+            # Batch Misra-Gries: subtract the (capacity + 1)-th largest count.
+            cut = np.partition(combined.to_numpy(), -(self.capacity + 1))[-(self.capacity + 1)]
+            combined = combined - cut
+            combined = combined[combined > 0]
+        self.counts = combined.sort_values(ascending=False, kind='stable')
+        return self
+
+    def to_dict(self):
+        items = [item.item() if isinstance(item, np.generic) else item
+                 for item in self.counts.index]
+        return {'capacity': self.capacity, 'items': items,
+                'counts': self.counts.tolist()}
+
+    @classmethod
+    def from_dict(cls, state):
+        sketch = cls(state['capacity'])
+        sketch.counts = pd.Series(state['counts'], index=state['items'], dtype=np.float64)
+        return sketch
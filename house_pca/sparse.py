@@ -0,0 +1,138 @@
+"""PCA with a handful of raw features per component.
+
+Every dense component mixes all standardized features, so scoring a listing
+requires collecting and cleaning every field.  ``SparseLoadingPCA`` fits
+components with at most ``n_nonzero`` non-zero loadings each.  It uses the
+truncated power method: a power iteration on the standardized covariance
+that keeps only the largest-magnitude entries at every step, followed by
+projection deflation before the next component.  The fit works on the
+p x p covariance only, after one pass for the ``Moments``.
+
+The scaler is folded into a ``scipy.sparse`` weight matrix over the union of
+the used features (``used_columns_``).  ``transform`` gathers just those
+columns and computes one sparse product.  ``source_columns`` lists the raw
+CSV columns those features come from, so a scoring feed can be read with
+``usecols``.  Sparse components are not orthogonal, so
+``adjusted_variance_`` reports the variance each one adds beyond the
+previous ones.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.base import BaseEstimator, TransformerMixin
+
+from .decomposition import align_signs, covariance_eig
+from .moments import Moments
+
+# Engineered features and the raw columns they are computed from.
+FEATURE_SOURCES = {'Buiding_age': ('YearBuilt',), 'Remodel_age': ('YearRemodAdd',)}
+
+
+def truncated_power(cov, n_nonzero, start, max_iter=200, tol=1e-10):
+    """Leading unit vector of ``cov`` with at most ``n_nonzero`` non-zero entries."""
+    v = np.asarray(start, dtype=np.float64)
+    for _ in range(max_iter):
+        w = cov @ v
+        if n_nonzero < len(w):
+            w[np.argpartition(np.abs(w), -n_nonzero)[:-n_nonzero]] = 0.0
+        norm = np.linalg.norm(w)
+        if norm == 0:
+            break
+        w /= norm
+        done = np.linalg.norm(w - v) < tol
+        v = w
+        if done:
+            break
+    return v
+
+
+class SparseLoadingPCA(TransformerMixin, BaseEstimator):
+    """Cardinality-constrained PCA on standardized features.
+
+    Parameters
+    ----------
+    n_components : int
+        Sparse components to fit.
+    n_nonzero : int or list of int
+        Non-zero loadings allowed per component.
+    max_iter : int
+        Truncated power iterations per component.
+    """
+
+    def __init__(self, n_components=5, n_nonzero=6, max_iter=200):
+        self.n_components = n_components
+        self.n_nonzero = n_nonzero
+        self.max_iter = max_iter
+
+    def fit(self, X, y=None):
+        self.feature_names_in_ = (np.asarray(X.columns, dtype=object)
+                                  if isinstance(X, pd.DataFrame) else None)
+        moments = Moments.from_array(X)
+        self.mean_ = moments.mean
+        self.scale_ = moments.std(ddof=0)
+        cov = moments.standardized_covariance()
+        n_features = cov.shape[0]
+        budgets = np.broadcast_to(self.n_nonzero, (self.n_components,))
+
+        components = np.zeros((n_features, self.n_components))
+        deflated = cov.copy()
+        for i, budget in enumerate(budgets):
+            _, start = covariance_eig(deflated, 1)
+            v = truncated_power(deflated, int(budget), start[:, 0], self.max_iter)
+            components[:, i] = v
+            # Projection deflation keeps later components off the span of earlier ones.
+            projector = np.eye(n_features) - np.outer(v, v)
+            deflated = projector @ deflated @ projector
+
+        # Same sign convention as the dense components; + 0.0 clears negative zeros.
+        components = align_signs(components) + 0.0
+        self.components_ = components.T
+        gram = components.T @ cov @ components
+        self.explained_variance_ = np.diag(gram).copy()
+        # Variance added by each component beyond the previous ones.
+        self.adjusted_variance_ = np.diag(np.linalg.cholesky(gram)) ** 2
+        self.total_variance_ = np.trace(cov)
+
+        used = np.flatnonzero(np.any(components != 0, axis=1))
+        self.used_index_ = used
+        weight = components[used] / self.scale_[used, None]
+        self.weight_ = sparse.csc_matrix(weight)
+        self.bias_ = -self.mean_[used] @ weight
+        return self
+
+    @property
+    def used_columns_(self):
+        """Features with a non-zero loading on any component."""
+        if self.feature_names_in_ is None:
+            return list(self.used_index_)
+        return list(self.feature_names_in_[self.used_index_])
+
+    def source_columns(self):
+        """Raw CSV columns needed to compute ``used_columns_``."""
+        columns = []
+        for feature in self.used_columns_:
+            for source in FEATURE_SOURCES.get(feature, (feature,)):
+                if source not in columns:
+                    columns.append(source)
+        return columns
+
+    def loadings_frame(self):
+        """Non-zero loadings as a (feature x component) DataFrame."""
+        labels = [f'PC{i + 1}' for i in range(self.n_components)]
+        return pd.DataFrame(self.components_[:, self.used_index_].T, index=self.used_columns_,
+                            columns=labels)
+
+    def transform(self, X):
+        """Scores from the used columns only: ``X_used @ W + b`` with sparse ``W``.
+
+        ``X`` may be a DataFrame holding (at least) ``used_columns_`` or an
+        array with all fitted features.
+        """
+        if isinstance(X, pd.DataFrame) and self.feature_names_in_ is not None:
+            used = X[self.used_columns_].to_numpy(dtype=np.float64)
+        else:
+            used = np.asarray(X, dtype=np.float64)[:, self.used_index_]
+        out = np.asarray(self.weight_.T @ used.T).T
+        out += self.bias_
+        return out
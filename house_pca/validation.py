@@ -0,0 +1,182 @@
+"""Schema, dtype, range and category checks before anything reaches cov_mat.
+
+Each rule becomes one boolean mask over the whole frame (or chunk): numeric
+comparisons on the column's array, ``isin`` hash lookups for categories,
+``to_numeric`` coercion for values that do not parse, and a level lookup
+gathered through the codes of categorical columns.  The bad-row mask, the
+per-check counts and the quarantined rows all come from array reductions,
+with no Python loop over rows.
+"""
+
+import datetime as dt
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class ColumnRule:
+    """Constraints on one column.
+
+    ``kind`` is ``'numeric'`` or ``'category'``.  ``min`` / ``max`` bound
+    numeric values (inclusive); ``allowed`` lists category levels;
+    ``nullable=False`` turns missing values into violations; ``required=False``
+    lets the column be absent (e.g. engineered columns before engineering).
+    """
+
+    kind: str = 'numeric'
+    min: float = None
+    max: float = None
+    allowed: frozenset = None
+    nullable: bool = True
+    required: bool = True
+
+
+@dataclass
+class ValidationReport:
+    """Outcome of ``Schema.validate``.
+
+    ``violations`` has one row per failed check with its count, ``valid`` and
+    ``quarantine`` split the input rows, and ``failures`` is the boolean
+    matrix of failed checks restricted to the quarantined rows.  Numeric-rule
+    columns that were read as text are converted to numbers in ``valid``.
+    """
+
+    valid: pd.DataFrame
+    quarantine: pd.DataFrame
+    violations: pd.DataFrame
+    failures: pd.DataFrame
+
+    @property
+    def ok(self):
+        return self.quarantine.empty and self.violations.empty
+
+
+class Schema:
+    """Named column rules applied with vectorized masks."""
+
+    def __init__(self, rules):
+        self.rules = dict(rules)
+
+    def dtypes(self):
+        """``read_csv`` dtypes that parse category columns straight to categoricals.
+
+        Validating a categorical column only inspects its few levels and
+        gathers through the integer codes, so reading with these dtypes keeps
+        validation a small fraction of ingestion time.
+        """
+        return {column: 'category' for column, rule in self.rules.items()
+                if rule.kind == 'category'}
+
+    def _checks(self, frame):
+        n_rows = len(frame)
+        for column, rule in self.rules.items():
+            if column not in frame.columns:
+                if rule.required:
+                    yield column, 'missing column', np.ones(n_rows, dtype=bool)
+                continue
+            series = frame[column]
+            if rule.kind == 'numeric':
+                if pd.api.types.is_numeric_dtype(series.dtype):
+                    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                    null = np.isnan(values)
+                else:
+                    null = series.isna().to_numpy()
+                    values = pd.to_numeric(series, errors='coerce').to_numpy(
+                        dtype=np.float64, na_value=np.nan)
+                    yield column, 'not numeric', np.isnan(values) & ~null
+                if not rule.nullable:
+                    yield column, 'null', null
+                if rule.min is not None:
+                    yield column, f'< {rule.min:g}', values < rule.min
+                if rule.max is not None:
+                    yield column, f'> {rule.max:g}', values > rule.max
+                continue
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes = series.cat.codes.to_numpy()
+                null = codes < 0
+                if rule.allowed is not None:
+                    bad_level = np.append(~series.cat.categories.isin(rule.allowed), False)
+                    yield column, 'unexpected category', bad_level[codes]
+            else:
+                null = series.isna().to_numpy() if not rule.nullable else None
+                if rule.allowed is not None:
+                    yield column, 'unexpected category', \
+                        ~series.isin([*rule.allowed, np.nan]).to_numpy()
+            if not rule.nullable:
+                yield column, 'null', null
+
+    def validate(self, frame):
+        """Check ``frame`` and split it into valid and quarantined rows."""
+        names, masks = [], []
+        bad = np.zeros(len(frame), dtype=bool)
+        for column, check, mask in self._checks(frame):
+            if mask.any():
+                names.append((column, check))
+                masks.append(mask)
+                bad |= mask
+        violations = pd.DataFrame({'column': [c for c, _ in names],
+                                   'check': [k for _, k in names],
+                                   'rows': [int(m.sum()) for m in masks]})
+        columns = pd.MultiIndex.from_tuples(names, names=['column', 'check']) if names else None
+        failures = pd.DataFrame(np.column_stack([m[bad] for m in masks]) if masks else
+                                np.zeros((int(bad.sum()), 0), dtype=bool),
+                                index=frame.index[bad], columns=columns)
+        # Numeric columns that arrived as text hold only parseable values in the
+        # valid rows; convert them so they are not dropped from ``df_num``.
+        valid = frame[~bad]
+        numeric = {column: pd.to_numeric(valid[column], errors='coerce')
+                   for column, rule in self.rules.items()
+                   if rule.kind == 'numeric' and column in frame.columns
+                   and not pd.api.types.is_numeric_dtype(frame[column].dtype)}
+        if numeric:
+            valid = valid.assign(**numeric)
+        return ValidationReport(valid, frame[bad], violations, failures)
+
+    def validate_chunks(self, chunks):
+        """Yield a ``ValidationReport`` per chunk of a streamed input."""
+        for chunk in chunks:
+            yield self.validate(chunk)
+
+
+QUALITY_LEVELS = frozenset(['Ex', 'Gd', 'TA', 'Fa', 'Po'])
+
+
+def house_schema(current_year=None):
+    """Rules for houseprice.csv, accepting both raw NaNs and the PCA.py fill labels."""
+    year = int(dt.datetime.now().year) if current_year is None else current_year
+    rules = {
+        'MSSubClass': ColumnRule(min=20, max=190, nullable=False),
+        'MSZoning': ColumnRule('category', allowed=frozenset(
+            ['A', 'C (all)', 'FV', 'I', 'RH', 'RL', 'RP', 'RM']), nullable=False),
+        'LotFrontage': ColumnRule(min=0),
+        'LotArea': ColumnRule(min=1, nullable=False),
+        'Street': ColumnRule('category', allowed=frozenset(['Grvl', 'Pave'])),
+        'Alley': ColumnRule('category', allowed=frozenset(['Grvl', 'Pave', 'No alley access'])),
+        'OverallQual': ColumnRule(min=1, max=10, nullable=False),
+        'OverallCond': ColumnRule(min=1, max=10, nullable=False),
+        'YearBuilt': ColumnRule(min=1800, max=year, nullable=False),
+        'YearRemodAdd': ColumnRule(min=1800, max=year, nullable=False),
+        'CentralAir': ColumnRule('category', allowed=frozenset(['N', 'Y'])),
+        'MoSold': ColumnRule(min=1, max=12, nullable=False),
+        'YrSold': ColumnRule(min=1800, max=year, nullable=False),
+        'SalePrice': ColumnRule(min=1, required=False),
+        'Buiding_age': ColumnRule(min=0, required=False),
+        'Remodel_age': ColumnRule(min=0, required=False),
+        'GarageYrBlt': ColumnRule(min=0, max=year + 1),
+    }
+    for column in ['MasVnrArea', 'BsmtFinSF1', 'BsmtFinSF2', 'BsmtUnfSF', 'TotalBsmtSF',
+                   '1stFlrSF', '2ndFlrSF', 'LowQualFinSF', 'GrLivArea', 'BsmtFullBath',
+                   'BsmtHalfBath', 'FullBath', 'HalfBath', 'BedroomAbvGr', 'KitchenAbvGr',
+                   'TotRmsAbvGrd', 'Fireplaces', 'GarageCars', 'GarageArea', 'WoodDeckSF',
+                   'OpenPorchSF', 'EnclosedPorch', '3SsnPorch', 'ScreenPorch', 'PoolArea',
+                   'MiscVal']:
+        rules[column] = ColumnRule(min=0)
+    fills = {'BsmtQual': 'No Basement', 'BsmtCond': 'No Basement',
+             'FireplaceQu': 'No Fireplace', 'GarageQual': 'No Garage',
+             'GarageCond': 'No Garage', 'PoolQC': 'No Pool'}
+    for column in ['ExterQual', 'ExterCond', 'HeatingQC', 'KitchenQual', *fills]:
+        levels = QUALITY_LEVELS | {fills[column]} if column in fills else QUALITY_LEVELS
+        rules[column] = ColumnRule('category', allowed=frozenset(levels))
+    return Schema(rules)
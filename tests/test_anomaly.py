@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from house_pca.anomaly import ReconstructionScorer
+from house_pca.decomposition import covariance_eig
+
+
+def _fitted(k=3):
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((1000, 8)) @ rng.standard_normal((8, 8)) + rng.normal(size=8)
+    mean, scale = X.mean(axis=0), X.std(axis=0)
+    eig_val, eig_vec = covariance_eig(np.cov(((X - mean) / scale).T), k)
+    return X, ReconstructionScorer(eig_vec, eig_val, mean, scale, chunk_size=64)
+
+
+def test_scores_match_explicit_reconstruction():
+    X, scorer = _fitted()
+    z = (X - scorer.mean) / scorer.scale
+    scores = z @ scorer.eig_vec
+    reconstructed = scores @ scorer.eig_vec.T
+
+    spe, t2 = scorer.score(X)
+    np.testing.assert_allclose(spe, np.sum((z - reconstructed) ** 2, axis=1), atol=1e-9)
+    np.testing.assert_allclose(t2, np.sum(scores ** 2 * scorer.inv_sqrt_val ** 2, axis=1),
+                               rtol=1e-12)
+
+    chunked = list(scorer.score_chunks([X[:100], X[100:]]))
+    np.testing.assert_array_equal(np.concatenate([s for s, _ in chunked]), spe)
+    np.testing.assert_array_equal(np.concatenate([t for _, t in chunked]), t2)
+
+
+def test_flag_uses_training_thresholds():
+    X, scorer = _fitted()
+    with pytest.raises(ValueError):
+        scorer.flag(X)
+    flags = scorer.fit_threshold(X, quantile=0.95).flag(X)
+    assert 0.05 <= flags.mean() <= 0.10
+    assert scorer.flag(X[:1] + 100 * scorer.scale).all()
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from house_pca.bootstrap import _replicates, bootstrap_pca
+from house_pca.decomposition import data_eig
+
+
+def _frame():
+    # Two factors of clearly different strength, so the eigenvalues are well separated.
+    rng = np.random.default_rng(0)
+    factors = rng.standard_normal((300, 2))
+    loadings = np.array([[1.0, 1.0, 1.0, 1.0, 1.0], [1.0, -1.0, 0.5, -0.5, 0.0]])
+    values = factors @ loadings + 0.3 * rng.standard_normal((300, 5))
+    return pd.DataFrame(values * 10 + 50, columns=list('abcde'))
+
+
+def test_replicate_equals_fit_on_resampled_rows():
+    X = _frame().to_numpy()
+    _, reference = data_eig((X - X.mean(axis=0)) / X.std(axis=0), 3)
+    counts = np.random.default_rng(1).multinomial(len(X), np.full(len(X), 1 / len(X)), size=2)
+
+    eig_val, eig_vec = _replicates(X, counts.astype(float), 3, reference)
+    for b in range(2):
+        resampled = np.repeat(X, counts[b], axis=0)
+        expected_val, expected_vec = data_eig(
+            (resampled - resampled.mean(axis=0)) / resampled.std(axis=0), 3)
+        expected_vec *= np.sign(np.sum(expected_vec * reference, axis=0))
+        np.testing.assert_allclose(eig_val[b], expected_val, rtol=1e-10)
+        np.testing.assert_allclose(eig_vec[b], expected_vec, atol=1e-8)
+
+
+def test_result_is_seeded_and_independent_of_threads():
+    frame = _frame()
+    one = bootstrap_pca(frame, n_components=2, n_boot=50, batch_size=8, n_jobs=1,
+                        random_state=7)
+    many = bootstrap_pca(frame, n_components=2, n_boot=50, batch_size=8, n_jobs=4,
+                         random_state=7)
+    np.testing.assert_array_equal(one.replicate_val, many.replicate_val)
+    assert one.replicate_vec.shape == (50, 5, 2)
+
+    intervals = one.eigenvalue_intervals()
+    assert ((intervals['lower'] <= intervals['eigenvalue'])
+            & (intervals['eigenvalue'] <= intervals['upper'])).all()
+    assert (intervals['mean_abs_cosine'] > 0.9).all()
+
+    table = one.loading_intervals()
+    assert len(table) == 5 * 2
+    assert set(table['feature']) == set('abcde')
@@ -0,0 +1,20 @@
+import numpy as np
+
+from house_pca import cache as cache_module
+from house_pca.cache import DecompositionCache
+from house_pca.decomposition import covariance_eig
+
+
+def test_format_change_invalidates_disk_entries(tmp_path, monkeypatch):
+    cov = np.cov(np.random.default_rng(0).standard_normal((50, 4)).T)
+    first = DecompositionCache(directory=tmp_path)
+    covariance_eig(cov, cache=first)
+
+    reader = DecompositionCache(directory=tmp_path)
+    covariance_eig(cov, cache=reader)
+    assert (reader.hits, reader.misses) == (1, 0)
+
+    monkeypatch.setattr(cache_module, 'CACHE_FORMAT', cache_module.CACHE_FORMAT + 1)
+    bumped = DecompositionCache(directory=tmp_path)
+    covariance_eig(cov, cache=bumped)
+    assert (bumped.hits, bumped.misses) == (0, 1)
@@ -0,0 +1,36 @@
+import os
+
+import numpy as np
+from sklearn.decomposition import PCA
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import KFold
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from house_pca import kfold_pca_regression
+from house_pca.pipeline import TARGET, clean, engineer, load, numeric_features
+from house_pca.seeding import make_rng
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         'houseprice.csv')
+
+
+def test_matches_sklearn_per_fold_pipeline():
+    data = engineer(clean(load(DATA_PATH), medians={}), current_year=2024)
+    X = numeric_features(data).to_numpy(dtype=float)
+    y = data[TARGET].to_numpy(dtype=float)
+    assert np.isnan(X).any()
+
+    result = kfold_pca_regression(X, y, max_components=4, n_splits=5, random_state=3)
+
+    order = make_rng(3).permutation(len(X))
+    X, y = X[order], y[order]
+    for fold, (train, test) in enumerate(KFold(5).split(X)):
+        for k in range(1, 5):
+            model = make_pipeline(SimpleImputer(strategy='median'), StandardScaler(),
+                                  PCA(k, svd_solver='full'), LinearRegression())
+            model.fit(X[train], y[train])
+            rmse = np.sqrt(np.mean((model.predict(X[test]) - y[test]) ** 2))
+            np.testing.assert_allclose(result.rmse.loc[fold, k], rmse, rtol=1e-7)
+
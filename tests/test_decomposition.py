@@ -0,0 +1,30 @@
+import numpy as np
+
+from house_pca.decomposition import align_signs, covariance_eig, refresh_eig
+from house_pca.moments import Moments
+
+
+def test_refresh_reaches_cold_eigendecomposition():
+    rng = np.random.default_rng(0)
+    n_features, k = 60, 5
+    rotation, _ = np.linalg.qr(rng.standard_normal((n_features, n_features)))
+    scales = 1.0 / np.arange(1, n_features + 1) ** 0.8
+    old = Moments.from_array(rng.standard_normal((600, n_features)) * scales @ rotation)
+    new = old + Moments.from_array(rng.standard_normal((60, n_features)) * scales @ rotation)
+    _, previous = covariance_eig(old.covariance(), k)
+
+    cold_val, cold_vec = covariance_eig(new.covariance(), k)
+    warm_val, warm_vec, n_iter = refresh_eig(new.covariance(), previous, return_n_iter=True)
+    assert n_iter < 100
+    np.testing.assert_allclose(warm_val, cold_val, rtol=1e-10)
+    np.testing.assert_allclose(warm_vec, cold_vec, atol=1e-6)
+
+
+def test_sign_pivot_ignores_round_off_ties():
+    # Equal-magnitude entries of opposite sign, as for YearBuilt and Buiding_age;
+    # whichever wins by round-off, the first one sets the sign.
+    tie = np.array([[0.6], [-0.6], [0.2]])
+    for nudge in (1 + 1e-12, 1 - 1e-12):
+        vector = tie * [[1.0], [nudge], [1.0]]
+        np.testing.assert_array_equal(np.sign(align_signs(vector)), [[1], [-1], [1]])
+        np.testing.assert_array_equal(np.sign(align_signs(-vector)), [[1], [-1], [1]])
@@ -0,0 +1,52 @@
+import os
+
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import PCA
+from sklearn.preprocessing import StandardScaler
+
+from house_pca.distributed import fit_distributed, shard_moments
+from house_pca.moments import Moments
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         'houseprice.csv')
+COLUMNS = ['LotFrontage', 'LotArea', 'GrLivArea', 'TotalBsmtSF', 'GarageArea', 'YearBuilt',
+           'SalePrice']
+
+
+def _shards(tmp_path):
+    raw = pd.read_csv(DATA_PATH, index_col=0)
+    paths = []
+    for i, (start, stop) in enumerate([(0, 500), (500, 1000), (1000, len(raw))]):
+        paths.append(str(tmp_path / f'shard{i}.csv'))
+        raw.iloc[start:stop].to_csv(paths[-1])
+    return raw, paths
+
+
+def test_matches_single_machine_fit(tmp_path):
+    raw, paths = _shards(tmp_path)
+    X = raw[COLUMNS].dropna().to_numpy(dtype=float)
+    scaler = StandardScaler().fit(X)
+    pca = PCA(4, svd_solver='full').fit(scaler.transform(X))
+
+    for mapper in (None, map):
+        result = fit_distributed(paths, COLUMNS, n_components=4, processes=2, mapper=mapper,
+                                 chunksize=250, read_csv_kwargs={'index_col': 0})
+        assert result.n_rows == len(X)
+        np.testing.assert_allclose(result.mean, scaler.mean_, rtol=1e-12)
+        np.testing.assert_allclose(result.scale, scaler.scale_, rtol=1e-10)
+        np.testing.assert_allclose(result.eig_val, pca.explained_variance_, rtol=1e-9)
+        # Component signs are arbitrary in sklearn; compare the scores up to sign.
+        signs = np.sign(np.sum(result.eig_vec * pca.components_.T, axis=0))
+        np.testing.assert_allclose(result.transform(X[:50]) * signs,
+                                   pca.transform(scaler.transform(X[:50])), atol=1e-8)
+
+
+def test_moments_survive_the_trip_to_the_coordinator(tmp_path):
+    _, paths = _shards(tmp_path)
+    moments = shard_moments(paths[0], COLUMNS, read_csv_kwargs={'index_col': 0})
+    moments.save(tmp_path / 'part.npz')
+    loaded = Moments.load(tmp_path / 'part.npz')
+    assert loaded.count == moments.count
+    np.testing.assert_array_equal(loaded.total, moments.total)
+    np.testing.assert_array_equal(loaded.cross, moments.cross)
@@ -0,0 +1,47 @@
+import numpy as np
+
+from house_pca.decomposition import covariance_eig
+from house_pca.drift import DriftMonitor
+
+FEATURES = list('abcdef')
+
+
+def _stream(rng, n_rows, shift=0.0):
+    factors = rng.standard_normal((n_rows, 2)) * [3.0, 1.5]
+    loadings = np.array([[1.0, 1.0, 1.0, 0.5, 0.5, 0.0], [1.0, -1.0, 0.0, 1.0, -1.0, 0.5]])
+    values = factors @ loadings + 0.5 * rng.standard_normal((n_rows, 6)) + 100.0
+    values[:, 2] += shift
+    return values
+
+
+def _monitor(rng):
+    X = _stream(rng, 20_000)
+    mean, scale = X.mean(axis=0), X.std(axis=0)
+    std_cov = np.cov(((X - mean) / scale).T)
+    eig_val, eig_vec = covariance_eig(std_cov, 2)
+    return DriftMonitor(eig_vec, eig_val, mean, scale, total_variance=np.trace(std_cov),
+                        features=FEATURES, halflife=5_000, min_rows=2_000), scale
+
+
+def test_stationary_stream_raises_no_alerts():
+    rng = np.random.default_rng(0)
+    monitor, _ = _monitor(rng)
+    alerts = [alert for _ in range(40) for alert in monitor.update(_stream(rng, 1_000))]
+    assert alerts == []
+    status = monitor.status()
+    assert status['max_angle'] < 5.0
+    assert abs(status['variance_shift']) < 0.01
+    assert len(monitor.report()) == 40
+
+
+def test_mean_shift_is_reported_with_its_feature():
+    rng = np.random.default_rng(1)
+    monitor, scale = _monitor(rng)
+    for _ in range(10):
+        assert monitor.update(_stream(rng, 1_000)) == []
+    alerts = []
+    for _ in range(10):
+        alerts += monitor.update(_stream(rng, 1_000, shift=scale[2]))
+    shifts = [alert for alert in alerts if alert.metric == 'mean_shift']
+    assert shifts and shifts[-1].detail == 'c'
+    assert shifts[-1].value > 0.5
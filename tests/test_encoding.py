@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from house_pca.encoding import ORDINAL_LEVELS, encode_ordinal, ordinal_codes
+
+LEVELS = ORDINAL_LEVELS['GarageQual']
+
+
+def test_codes_follow_declared_order_for_text_and_categoricals():
+    values = ['Ex', 'No Garage', 'TA', 'Po', 'Gd', 'Fa', 'TA']
+    expected = [5, 0, 3, 1, 4, 2, 3]
+    text = pd.Series(values, index=range(10, 17))
+    # Categories in alphabetical (not quality) order, plus an unused level.
+    categorical = text.astype(pd.CategoricalDtype(sorted(set(values)) + ['Zz']))
+
+    for series in (text, categorical):
+        codes = ordinal_codes(series, LEVELS)
+        assert codes.dtype == np.int8
+        assert codes.index.equals(text.index)
+        assert codes.tolist() == expected
+
+
+def test_missing_and_undeclared_values_become_nan():
+    text = pd.Series(['Gd', None, 'Excellent', 'Po'])
+    for series in (text, text.astype('category')):
+        codes = ordinal_codes(series, LEVELS)
+        np.testing.assert_array_equal(codes.to_numpy(), [4, np.nan, np.nan, 1])
+
+
+def test_encode_ordinal_replaces_only_declared_columns():
+    frame = pd.DataFrame({'KitchenQual': ['TA', 'Ex'], 'Street': ['Pave', 'Grvl']})
+    encoded = encode_ordinal(frame)
+    assert encoded['KitchenQual'].tolist() == [3, 5]
+    assert encoded['Street'].tolist() == ['Pave', 'Grvl']
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from house_pca.grouped import GroupedPCAModel, fit_grouped
+
+
+def _data(keys, sizes=(40, 40, 3)):
+    rng = np.random.default_rng(0)
+    groups = np.repeat(np.array(keys, dtype=object), sizes)
+    X = rng.standard_normal((len(groups), 4)) + np.repeat(np.arange(len(keys)), sizes)[:, None]
+    return X, groups
+
+
+@pytest.mark.parametrize('keys', [[20, 60, 120], ['NAmes', 'OldTown', 'Sawyer'], [1.5, 2.5, 4.0]])
+def test_save_load_keeps_routing(tmp_path, keys):
+    X, groups = _data(keys)
+    model = fit_grouped(X, groups, n_components=2, processes=1)
+    # The three-row group is too small for its own fit and uses the pooled slot.
+    np.testing.assert_array_equal(np.unique(model.route(groups)), [0, 1, 2])
+
+    path = tmp_path / 'grouped.npz'
+    model.save(path)
+    loaded = GroupedPCAModel.load(path)
+    assert list(loaded.keys) == keys[:2]
+    np.testing.assert_array_equal(loaded.route(groups), model.route(groups))
+    np.testing.assert_allclose(loaded.transform(X, groups), model.transform(X, groups))
+
+
+def test_save_rejects_mixed_keys(tmp_path):
+    X, groups = _data([1, 'a', 'b'])
+    model = fit_grouped(X, groups, n_components=2, processes=1)
+    with pytest.raises(TypeError):
+        model.save(tmp_path / 'grouped.npz')
@@ -0,0 +1,40 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from house_pca.impute import SketchImputer
+from house_pca.io import read_chunks
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         'houseprice.csv')
+
+
+def test_median_on_mixed_chunks_uses_numeric_columns():
+    raw = pd.read_csv(DATA_PATH, index_col=0)
+    imputer = SketchImputer('median').fit_chunks(read_chunks(DATA_PATH, 300, index_col=0))
+    numeric = raw.select_dtypes('number')
+    assert list(imputer.statistics_.index) == list(numeric.columns)
+    np.testing.assert_allclose(imputer.statistics_['LotFrontage'],
+                               numeric['LotFrontage'].median(), rtol=0.02)
+
+    restored = SketchImputer.from_dict(json.loads(json.dumps(imputer.to_dict())))
+    pd.testing.assert_series_equal(restored.statistics_, imputer.statistics_)
+    filled = restored.transform(raw)
+    assert filled[numeric.columns].notna().all().all()
+    assert filled['Alley'].isna().sum() == raw['Alley'].isna().sum()
+
+
+def test_most_frequent_round_trip():
+    raw = pd.read_csv(DATA_PATH, index_col=0)
+    imputer = SketchImputer('most_frequent', columns=['MSZoning', 'Electrical']).fit(raw)
+    restored = SketchImputer.from_dict(json.loads(json.dumps(imputer.to_dict())))
+    assert restored.statistics_.to_dict() == {'MSZoning': 'RL', 'Electrical': 'SBrkr'}
+
+
+def test_median_rejects_text_columns():
+    frame = pd.DataFrame({'area': [1.0, np.nan, 3.0], 'zone': ['RL', 'RM', None]})
+    with pytest.raises(ValueError, match='zone'):
+        SketchImputer('median', columns=['area', 'zone']).fit(frame)
@@ -0,0 +1,34 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from house_pca.incremental import IncrementalHousePCA
+from house_pca.io import read_chunks
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         'houseprice.csv')
+
+
+def _fit(path, chunksize):
+    return IncrementalHousePCA(current_year=2024).fit_chunks(
+        lambda: read_chunks(path, chunksize, index_col=0))
+
+
+def test_short_final_chunk_is_fitted():
+    # 1460 rows in chunks of 1455: the last chunk is smaller than the 15 tracked components.
+    model = _fit(DATA_PATH, 1455)
+    reference = _fit(DATA_PATH, 1460)
+    assert model.ipca.n_samples_seen_ == model.n_rows_ == 1460
+    # The second update truncates to 15 directions again, so agreement is close, not exact.
+    np.testing.assert_allclose(model.explained_variance_, reference.explained_variance_, rtol=1e-4)
+    np.testing.assert_allclose(np.abs(model.components_), np.abs(reference.components_),
+                               atol=1e-3)
+
+
+def test_fewer_rows_than_tracked_components(tmp_path):
+    path = tmp_path / 'listings.csv'
+    pd.read_csv(DATA_PATH, index_col=0).head(12).to_csv(path)
+    model = _fit(path, 4)
+    assert model.ipca.n_samples_seen_ == 12
+    assert model.components_.shape == (5, len(model.scaler.mean_))
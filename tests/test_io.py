@@ -0,0 +1,58 @@
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from house_pca.io import DECOMPRESSORS, open_decompressed, read_chunks
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         'houseprice.csv')
+OPENERS = {'.gz': (gzip.open, 'gzip'), '.bz2': (bz2.open, 'bz2'), '.xz': (lzma.open, 'xz')}
+
+
+def _compressed(tmp_path, suffix):
+    opener, _ = OPENERS[suffix]
+    path = str(tmp_path / f'houseprice.csv{suffix}')
+    with open(DATA_PATH, 'rb') as source, opener(path, 'wb') as target:
+        shutil.copyfileobj(source, target)
+    return path
+
+
+@pytest.mark.parametrize('suffix', sorted(OPENERS))
+@pytest.mark.parametrize('decompress', ['thread', 'process', None, 'pandas'])
+def test_compressed_chunks_match_plain_read(tmp_path, suffix, decompress):
+    if decompress == 'process' and not any(
+            shutil.which(tool) for tool in DECOMPRESSORS[OPENERS[suffix][1]]):
+        pytest.skip('no external decompressor on PATH')
+    expected = list(read_chunks(DATA_PATH, 300, index_col=0))
+    chunks = list(read_chunks(_compressed(tmp_path, suffix), 300, decompress=decompress,
+                              index_col=0))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 300, 260]
+    for chunk, plain in zip(chunks, expected):
+        pd.testing.assert_frame_equal(chunk, plain)
+
+
+def test_prefetch_with_tiny_buffer_and_early_close(tmp_path):
+    path = _compressed(tmp_path, '.gz')
+    with open(DATA_PATH, 'rb') as source:
+        expected = source.read()
+    with open_decompressed(path, block_size=1000, max_blocks=2) as stream:
+        assert stream.read() == expected
+    # Stopping before the end must not leave the producer blocked on a full queue.
+    with open_decompressed(path, block_size=1000, max_blocks=2) as stream:
+        assert stream.read(10) == expected[:10]
+
+
+def test_corrupt_input_raises_in_reader(tmp_path):
+    path = str(tmp_path / 'broken.csv.gz')
+    with open(path, 'wb') as target:
+        target.write(gzip.compress(b'a,b\n1,2\n')[:-6] + b'garbage!')
+    with pytest.raises((OSError, EOFError, gzip.BadGzipFile)):
+        list(read_chunks(path, 10, decompress='thread'))
+    with pytest.raises(ValueError):
+        with open_decompressed(path, decompress='fork'):
+            pass
@@ -0,0 +1,20 @@
+import numpy as np
+
+from house_pca.kernel import NystroemKernelPCA
+
+
+def test_signs_do_not_depend_on_eigh_signs(monkeypatch):
+    X = np.random.default_rng(0).standard_normal((400, 6))
+    expected = NystroemKernelPCA(n_landmarks=100).fit_transform(X)
+
+    eigh = np.linalg.eigh
+
+    def flipped(a, *args, **kwargs):
+        val, vec = eigh(a, *args, **kwargs)
+        vec = vec.copy()
+        vec[:, ::2] *= -1  # an equally valid eigendecomposition
+        return val, vec
+
+    monkeypatch.setattr(np.linalg, 'eigh', flipped)
+    np.testing.assert_allclose(NystroemKernelPCA(n_landmarks=100).fit_transform(X), expected,
+                               atol=1e-8)
@@ -0,0 +1,20 @@
+import numpy as np
+
+from house_pca.neighbors import ComparableIndex, brute_force_knn
+
+
+def test_index_with_inserts_matches_brute_force():
+    rng = np.random.default_rng(0)
+    scores = rng.standard_normal((5000, 5)) * [3.0, 2.0, 1.5, 1.0, 0.8]
+    queries = rng.standard_normal((50, 5)) * [3.0, 2.0, 1.5, 1.0, 0.8]
+    index = ComparableIndex(scores[:4900], rebuild_fraction=0.5)
+    index.add(scores[4900:], np.arange(4900, 5000))
+    assert len(index) == 5000
+
+    distances, ids = index.query(queries, k=20)
+    expected_d, expected_i = brute_force_knn(scores, queries, 20)
+    np.testing.assert_allclose(distances, expected_d, atol=1e-9)
+    np.testing.assert_array_equal(ids, expected_i)
+
+    index.rebuild()
+    np.testing.assert_array_equal(index.query(queries, k=20)[1], expected_i)
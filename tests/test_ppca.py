@@ -0,0 +1,30 @@
+import numpy as np
+
+from house_pca.ppca import ProbabilisticPCA
+
+
+def _data(n_rows=3000):
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((n_rows, 3)) @ rng.standard_normal((3, 8)) * np.arange(1, 9)
+    return X + 0.3 * rng.standard_normal(X.shape), rng
+
+
+def test_complete_data_matches_pca():
+    X, _ = _data()
+    model = ProbabilisticPCA(3).fit(X)
+    standardized = (X - X.mean(axis=0)) / X.std(axis=0)
+    _, eig_vec = np.linalg.eigh(np.cov(standardized.T))
+    cosines = np.abs(np.sum(model.components_ * eig_vec[:, ::-1][:, :3].T, axis=1))
+    assert model.converged_
+    np.testing.assert_allclose(cosines, 1.0, atol=1e-6)
+
+
+def test_acceleration_reaches_the_same_fit():
+    X, rng = _data()
+    X[rng.random(X.shape) < 0.2] = np.nan
+    plain = ProbabilisticPCA(3, accelerate=False, tol=1e-8).fit(X)
+    fast = ProbabilisticPCA(3, tol=1e-8).fit(X)
+    assert fast.n_iter_ <= plain.n_iter_
+    np.testing.assert_allclose(np.abs(np.sum(plain.components_ * fast.components_, axis=1)),
+                               1.0, atol=1e-6)
+    assert not np.isnan(fast.impute(X)).any()
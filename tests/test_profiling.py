@@ -0,0 +1,57 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from house_pca.profiling import profile_csv
+from house_pca.sketches import CardinalitySketch, FrequentItemsSketch, QuantileSketch
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         'houseprice.csv')
+
+
+def test_chunked_profile_matches_exact_statistics():
+    raw = pd.read_csv(DATA_PATH, index_col=0)
+    report = profile_csv(DATA_PATH, chunksize=200, read_csv_kwargs={'index_col': 0})
+
+    np.testing.assert_array_equal(report.loc[raw.columns, 'Total'], raw.isna().sum())
+    numeric = raw.select_dtypes('number')
+    exact = numeric.agg(['min', 'max', 'mean', 'std']).T
+    for statistic in ('min', 'max', 'mean', 'std'):
+        np.testing.assert_allclose(report.loc[numeric.columns, statistic].astype(float),
+                                   exact[statistic], rtol=1e-9)
+    # Distinct counts below the KMV size are exact.
+    np.testing.assert_array_equal(report.loc[raw.columns, 'cardinality'],
+                                  raw.nunique().to_numpy())
+    # Quantile estimates are within 2% in rank of the exact quantiles.
+    for column in numeric.columns:
+        values = np.sort(numeric[column].dropna().to_numpy())
+        for q in (0.25, 0.5, 0.75):
+            estimate = report.loc[column, f'q{q:g}']
+            low = np.searchsorted(values, estimate, side='left') / len(values)
+            high = np.searchsorted(values, estimate, side='right') / len(values)
+            assert low - 0.02 <= q <= high + 0.02, (column, q)
+
+
+def test_sketches_merge_and_round_trip():
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(size=20_000)
+    parts = np.array_split(values, 4)
+
+    merged = QuantileSketch(200)
+    for part in parts:
+        merged.merge(QuantileSketch(200).update(part))
+    restored = QuantileSketch.from_dict(merged.to_dict())
+    for q in (0.01, 0.5, 0.99):
+        rank = np.mean(values <= restored.quantile(q))
+        assert abs(rank - q) < 0.01
+
+    items = rng.choice(['a', 'b', 'c'], p=[0.6, 0.3, 0.1], size=5000).tolist() + \
+        [f'x{i}' for i in range(500)]
+    frequent = FrequentItemsSketch(16).update(items)
+    restored = FrequentItemsSketch.from_dict(frequent.to_dict())
+    assert list(restored.counts.index[:3]) == ['a', 'b', 'c']
+
+    distinct = CardinalitySketch(256)
+    distinct.update(pd.Series(np.arange(100_000)))
+    assert abs(CardinalitySketch.from_dict(distinct.to_dict()).estimate() / 100_000 - 1) < 0.2
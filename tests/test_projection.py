@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from sklearn.decomposition import PCA
+from sklearn.preprocessing import StandardScaler
+
+from house_pca.projection import AffineProjection
+
+
+def _data():
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((500, 6)) @ rng.standard_normal((6, 6)) * 100 + 1000
+
+
+@pytest.mark.parametrize('whiten', [False, True])
+def test_matches_sklearn_scaler_and_pca(whiten):
+    X = _data()
+    scaler = StandardScaler().fit(X)
+    pca = PCA(3, whiten=whiten, svd_solver='full').fit(scaler.transform(X))
+    projection = AffineProjection.from_sklearn(scaler, pca, whiten=whiten)
+
+    expected = pca.transform(scaler.transform(X))
+    np.testing.assert_allclose(projection.transform(X), expected, atol=1e-9)
+    np.testing.assert_allclose(projection.inverse_transform(expected),
+                               scaler.inverse_transform(pca.inverse_transform(expected)),
+                               rtol=1e-10)
+
+
+def test_full_rank_round_trip_and_out_buffers():
+    X = _data()
+    scaler = StandardScaler().fit(X)
+    pca = PCA(svd_solver='full').fit(scaler.transform(X))
+    projection = AffineProjection.from_sklearn(scaler, pca, whiten=True)
+
+    scores = np.empty((len(X), 6))
+    restored = np.empty_like(X)
+    assert projection.transform(X, out=scores) is scores
+    np.testing.assert_allclose(scores.var(axis=0, ddof=1), 1.0, rtol=1e-9)
+    assert projection.inverse_transform(scores, out=restored) is restored
+    np.testing.assert_allclose(restored, X, rtol=1e-10)
+
+    with pytest.raises(ValueError):
+        AffineProjection(scaler.mean_, scaler.scale_, pca.components_.T, whiten=True)
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from house_pca.quantize import QuantizedScores
+
+
+def _scores(index):
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal((len(index), 4)) * [5.0, 2.0, 1.0, 0.0]
+    return pd.DataFrame(values, index=index, columns=[f'PC{i + 1}' for i in range(4)])
+
+
+@pytest.mark.parametrize('dtype', ['int8', 'int16'])
+def test_rounding_error_within_bound(dtype):
+    scores = _scores(pd.RangeIndex(1, 1001, name='Id'))
+    quantized = QuantizedScores.from_scores(scores, dtype)
+    assert quantized.codes.dtype == dtype
+    report = quantized.error_report(scores)
+    assert (report['max_abs_error'] <= report['bound'] * (1 + 1e-9)).all()
+    assert report.loc['PC4', 'relative_rmse'] == 0.0
+    # The constant component decodes exactly.
+    np.testing.assert_array_equal(quantized.dequantize(columns=['PC4']), 0.0)
+
+
+@pytest.mark.parametrize('index', [pd.RangeIndex(1, 301, name='Id'),
+                                   pd.Index(np.arange(300)[::-1] * 7),
+                                   pd.Index([f'id{i}' for i in range(300)])])
+def test_save_load_memory_maps_codes(tmp_path, index):
+    quantized = QuantizedScores.from_scores(_scores(index), 'int16')
+    quantized.save(tmp_path / 'scores')
+
+    loaded = QuantizedScores.load(tmp_path / 'scores')
+    assert isinstance(loaded.codes, np.memmap)
+    assert not loaded.codes.flags.writeable
+    assert loaded.index.equals(quantized.index)
+    assert loaded.index.name == quantized.index.name
+    assert loaded.columns == quantized.columns
+    pd.testing.assert_frame_equal(loaded.to_frame(), quantized.to_frame())
+
+    rows = np.array([5, 0, 299])
+    np.testing.assert_array_equal(loaded.dequantize(rows, ['PC2', 0]),
+                                  quantized.dequantize()[rows][:, [1, 0]])
+
+    in_memory = QuantizedScores.load(tmp_path / 'scores', mmap_mode=None)
+    assert not isinstance(in_memory.codes, np.memmap)
+    np.testing.assert_array_equal(in_memory.codes, quantized.codes)
@@ -0,0 +1,35 @@
+import os
+
+import numpy as np
+from scipy.stats import chi2
+
+from house_pca.pipeline import HousePricePipeline
+from house_pca.robust import robust_covariance
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         'houseprice.csv')
+
+
+def test_zero_inflated_columns_do_not_collapse():
+    _, X = HousePricePipeline(DATA_PATH, current_year=2024).scale()
+    classical = np.cov(X.T)
+    # Whitening basis of the classical covariance, without its exact collinearities.
+    eig_val, eig_vec = np.linalg.eigh(classical)
+    basis = eig_vec[:, eig_val > 1e-8] / np.sqrt(eig_val[eig_val > 1e-8])
+
+    _, covariance, weights = robust_covariance(X)
+    assert np.linalg.eigvalsh(basis.T @ covariance @ basis).min() > 1e-3
+    assert weights.min() > 0.01
+
+    _, collapsed, weights = robust_covariance(X, min_variance=0.0)
+    assert np.linalg.eigvalsh(basis.T @ collapsed @ basis).min() < 1e-6
+
+
+def test_weights_match_returned_estimate():
+    _, X = HousePricePipeline(DATA_PATH, current_year=2024).scale()
+    cutoff = np.sqrt(chi2.ppf(0.9, X.shape[1]))
+    location, covariance, weights = robust_covariance(X, min_variance=0.05)
+    metric = covariance + 0.05 * np.cov(X.T)
+    centered = X - location
+    d2 = np.einsum('ij,ij->i', centered @ np.linalg.pinv(metric, hermitian=True), centered)
+    np.testing.assert_allclose(weights, np.minimum(1.0, cutoff / np.sqrt(d2)), rtol=1e-6)
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from house_pca.distributed import fit_from_moments
+from house_pca.moments import Moments
+from house_pca.rolling import RollingWindowPCA
+
+
+def _direct(X):
+    return fit_from_moments(Moments.from_array(X), list(range(X.shape[1])), 2)
+
+
+def test_partial_fit_across_a_month_gap():
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((240, 4)) * [1.0, 2.0, 3.0, 4.0] + 100.0
+    year = np.r_[np.full(120, 2009), np.full(120, 2010)]
+    month = np.r_[np.repeat(np.arange(1, 13), 10), np.full(120, 3)]
+
+    model = RollingWindowPCA(2).fit(X[:120], year[:120], month[:120])
+    # 2010-01 and 2010-02 hold no rows.
+    model.partial_fit(X[120:], year[120:], month[120:])
+    assert len(model.periods) == 15
+    assert model.month_counts.loc['2010-02'] == 0
+
+    window = model.window('2010-03', 15)
+    expected = _direct(X)
+    assert window.n_rows == 240
+    np.testing.assert_allclose(window.mean, expected.mean)
+    np.testing.assert_allclose(window.eig_val, expected.eig_val)
+    np.testing.assert_allclose(window.eig_vec, expected.eig_vec, atol=1e-8)
+
+    last = model.window('2010-03', 3)
+    assert last.n_rows == 120
+    np.testing.assert_allclose(last.eig_val, _direct(X[120:]).eig_val)
+
+
+def test_partial_fit_rejects_earlier_months():
+    X = np.random.default_rng(1).standard_normal((24, 3))
+    model = RollingWindowPCA(2).fit(X, np.full(24, 2009), np.repeat(np.arange(1, 13), 2))
+    with pytest.raises(ValueError):
+        model.partial_fit(X[:2], [2008, 2008], [12, 12])
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from house_pca.decomposition import covariance_eig
+from house_pca.sparse import SparseLoadingPCA
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    factors = rng.standard_normal((500, 3)) * [3.0, 2.0, 1.0]
+    loadings = rng.standard_normal((3, 10))
+    values = factors @ loadings + 0.5 * rng.standard_normal((500, 10)) + 20.0
+    columns = [f'x{i}' for i in range(8)] + ['YearBuilt', 'Buiding_age']
+    return pd.DataFrame(values, columns=columns)
+
+
+def test_full_budget_reproduces_dense_pca():
+    X = _frame()
+    model = SparseLoadingPCA(n_components=3, n_nonzero=10).fit(X)
+    X_std = StandardScaler().fit_transform(X)
+    eig_val, eig_vec = covariance_eig(np.cov(X_std.T), 3)
+
+    np.testing.assert_allclose(model.components_.T, eig_vec, atol=1e-6)
+    np.testing.assert_allclose(model.explained_variance_, eig_val, rtol=1e-9)
+    np.testing.assert_allclose(model.adjusted_variance_, eig_val, rtol=1e-6)
+    np.testing.assert_allclose(model.transform(X), X_std @ eig_vec, atol=1e-5)
+    # Buiding_age is read through YearBuilt, which is listed once.
+    assert model.source_columns() == [f'x{i}' for i in range(8)] + ['YearBuilt']
+
+
+def test_sparse_transform_reads_only_used_columns():
+    X = _frame()
+    model = SparseLoadingPCA(n_components=2, n_nonzero=[3, 2]).fit(X)
+    assert [np.count_nonzero(row) for row in model.components_] == [3, 2]
+    assert model.loadings_frame().shape == (len(model.used_columns_), 2)
+
+    dense = StandardScaler().fit_transform(X) @ model.components_.T
+    np.testing.assert_allclose(model.transform(X[model.used_columns_]), dense, atol=1e-10)
+    np.testing.assert_allclose(model.transform(X.to_numpy()), dense, atol=1e-10)
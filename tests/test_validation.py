@@ -0,0 +1,22 @@
+import os
+
+import pandas as pd
+
+from house_pca.pipeline import HousePricePipeline
+from house_pca.validation import house_schema
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         'houseprice.csv')
+
+
+def test_quarantined_text_value_keeps_numeric_column(tmp_path):
+    raw = pd.read_csv(DATA_PATH, index_col=0).astype({'LotArea': object})
+    raw.loc[raw.index[5], 'LotArea'] = 'abc'
+    path = tmp_path / 'listings.csv'
+    raw.to_csv(path)
+
+    pipeline = HousePricePipeline(path, current_year=2024, schema=house_schema(2024))
+    reference = HousePricePipeline(DATA_PATH, current_year=2024)
+    assert pipeline.feature_names == reference.feature_names
+    assert list(pipeline.quarantine.index) == [raw.index[5]]
+    assert pd.api.types.is_numeric_dtype(pipeline.clean()['LotArea'])